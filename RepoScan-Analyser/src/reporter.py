@@ -7,6 +7,16 @@ from datetime import datetime
 from .parser import CodeSnippet
 from .config import ScannerConfig
 
+# Shared style objects; assigning these avoids building a new Font/PatternFill per cell
+_HEADER_FONT = Font(bold=True, color="FFFFFF")
+_HEADER_FILL = PatternFill("solid", fgColor="4F81BD")
+_RED_FILL = PatternFill("solid", fgColor="FFC7CE")
+_RED_FONT = Font(color="9C0006")
+_YELLOW_FILL = PatternFill("solid", fgColor="FFEB9C")
+_YELLOW_FONT = Font(color="9C6500")
+_GREEN_FILL = PatternFill("solid", fgColor="C6EFCE")
+_GREEN_FONT = Font(color="006100")
+
 class Reporter:
     def __init__(self, config: ScannerConfig, findings: List[CodeSnippet]):
         self.config = config
@@ -234,8 +244,8 @@ class Reporter:
         for col, h in enumerate(headers, 1):
             cell = ws.cell(row=header_row, column=col)
             cell.value = h
-            cell.font = Font(bold=True, color="FFFFFF")
-            cell.fill = PatternFill("solid", fgColor="4F81BD")
+            cell.font = _HEADER_FONT
+            cell.fill = _HEADER_FILL
             cell.alignment = Alignment(horizontal="left")
 
         # Table Data
@@ -426,8 +436,8 @@ class Reporter:
         ws = self.wb.create_sheet(title)
         
         # Header Style
-        header_font = Font(bold=True, color="FFFFFF")
-        header_fill = PatternFill("solid", fgColor="4F81BD")
+        header_font = _HEADER_FONT
+        header_fill = _HEADER_FILL
         alignment = Alignment(horizontal="left", vertical="center", wrap_text=True)
         thin_border = Border(left=Side(style='thin'), right=Side(style='thin'), top=Side(style='thin'), bottom=Side(style='thin'))
 
@@ -550,11 +560,11 @@ class Reporter:
                 # Server Dependencies column (J = column 10 now due to shift)
                 server_cell = ws.cell(row=row, column=10)
                 if server_cell.value == "Yes":
-                    server_cell.fill = PatternFill("solid", fgColor="FFC7CE")  # Red
-                    server_cell.font = Font(color="9C0006")
+                    server_cell.fill = _RED_FILL
+                    server_cell.font = _RED_FONT
                 else:
-                    server_cell.fill = PatternFill("solid", fgColor="C6EFCE")  # Green
-                    server_cell.font = Font(color="006100")
+                    server_cell.fill = _GREEN_FILL
+                    server_cell.font = _GREEN_FONT
 
     def _create_refactoring_sheet(self, category_filter: str = None):
         """Generates Tab 4: Refactoring & Extraction Tracker (Developer Checklist).
@@ -633,14 +643,14 @@ class Reporter:
                 status_cell = ws.cell(row=row, column=7)
                 val = status_cell.value
                 if "Blocked" in val:
-                    status_cell.fill = PatternFill("solid", fgColor="FFC7CE") # Red
-                    status_cell.font = Font(color="9C0006")
+                    status_cell.fill = _RED_FILL
+                    status_cell.font = _RED_FONT
                 elif "Skipped" in val or "Manual" in val:
-                    status_cell.fill = PatternFill("solid", fgColor="FFEB9C") # Yellow
-                    status_cell.font = Font(color="9C6500")
+                    status_cell.fill = _YELLOW_FILL
+                    status_cell.font = _YELLOW_FONT
                 elif "Ready" in val:
-                    status_cell.fill = PatternFill("solid", fgColor="C6EFCE") # Green
-                    status_cell.font = Font(color="006100")
+                    status_cell.fill = _GREEN_FILL
+                    status_cell.font = _GREEN_FONT
 
     def _create_refactoring_summary(self):
         """Creates a Dashboard Summary for the Refactoring Tracker."""
@@ -686,8 +696,8 @@ class Reporter:
         # Header Row
         for col, h in enumerate(headers, 1):
             cell = ws.cell(row=3, column=col, value=h)
-            cell.font = Font(bold=True, color="FFFFFF")
-            cell.fill = PatternFill("solid", fgColor="4F81BD")
+            cell.font = _HEADER_FONT
+            cell.fill = _HEADER_FILL
             
         # Data
         for i, (metric, count, desc) in enumerate(data):
@@ -7,6 +7,8 @@ from .config import ScannerConfig
 class Scanner:
     def __init__(self, config: ScannerConfig):
         self.config = config
+        # Hashed membership for the per-directory exclude check
+        self._exclude_dirs = frozenset(config.exclude_folders)
 
     def scan(self) -> Generator[str, None, None]:
         """
@@ -16,7 +18,7 @@ class Scanner:
         
         for root, dirs, files in os.walk(self.config.root_folder):
             # Modify dirs in-place to skip excluded folders
-            dirs[:] = [d for d in dirs if d not in self.config.exclude_folders]
+            dirs[:] = [d for d in dirs if d not in self._exclude_dirs]
             
             for file in files:
                 file_path = os.path.join(root, file)
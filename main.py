@@ -2,8 +2,10 @@ import sys
 import os
 import shutil
 import time
-import glob
 import logging
+import multiprocessing
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from src.config import parse_arguments
 from src.scanner import Scanner
 from src.reader import FileReader
@@ -17,29 +19,34 @@ except ImportError:
     generate_report = None
     logging.warning("Could not import refactoring_utility.check. Assessment tracker will not be generated.")
 
+def _is_old_report(name: str) -> bool:
+    # Current artefacts plus the dated scan reports written by earlier versions
+    return (name in ("Analysis.xlsx", "extracted_code.zip")
+            or (name.startswith("InlineCode_Scan_") and name.endswith(".xlsx")))
+
 def cleanup_old_reports(output_folder: str):
     """Removes previous scan reports to keep the output folder clean."""
-    if not os.path.exists(output_folder):
+    # One directory pass: name checks only, no glob pattern or intermediate list
+    try:
+        it = os.scandir(output_folder)
+    except FileNotFoundError:
         return
-        
-    pattern = os.path.join(output_folder, "Analysis.xlsx")
-    files = glob.glob(pattern)
-    if files:
-        logging.info(f"Cleaning up old report(s) in {output_folder}...")
-        for f in files:
-            try:
-                os.remove(f)
-            except OSError as e:
-                logging.error(f"Could not delete {f}: {e}")
-    
-    # Clean up extracted_code folder
-    extracted_code_dir = os.path.join(output_folder, "extracted_code")
-    if os.path.exists(extracted_code_dir):
-        try:
-            logging.info(f"Removing old extracted code in {extracted_code_dir}...")
-            shutil.rmtree(extracted_code_dir)
-        except OSError as e:
-            logging.error(f"Could not delete extracted codes directory {extracted_code_dir}: {e}")
+
+    announced = False
+    with it:
+        for entry in it:
+            if entry.name == "extracted_code" and entry.is_dir(follow_symlinks=False):
+                # Folder layout used by older runs
+                logging.info(f"Removing old extracted code in {entry.path}...")
+                shutil.rmtree(entry.path, onerror=lambda func, path, exc: logging.error(f"Could not delete {path}: {exc[1]}"))
+            elif _is_old_report(entry.name) and entry.is_file(follow_symlinks=False):
+                if not announced:
+                    logging.info(f"Cleaning up old report(s) in {output_folder}...")
+                    announced = True
+                try:
+                    os.remove(entry.path)
+                except OSError as e:
+                    logging.error(f"Could not delete {entry.path}: {e}")
 
 def main():
     # 0. Setup Logging
@@ -56,8 +63,7 @@ def main():
         config = parse_arguments()
         
         # Ensure Output Directory Exists
-        if not os.path.exists(config.output_folder):
-            os.makedirs(config.output_folder)
+        os.makedirs(config.output_folder, exist_ok=True)
             
         print(f"Root Folder: {os.path.abspath(config.root_folder)}")
         print(f"Output Folder: {os.path.abspath(config.output_folder)}")
@@ -86,44 +92,68 @@ def main():
     
     print("\nDone.")
 
-def run_static_scan(config):
-    # 2. Scanning
-    print("\n[Phase 1] Discovery...")
+def process_file(parser: Parser, file_path: str) -> list:
+    """Reads and parses one file; returns its findings (empty on read/parse failure)."""
+    # Read
+    content, encoding = FileReader.read_file(file_path)
+    if content is None:
+        logging.warning(f"Skipping file {file_path}: {encoding}")
+        return []
+
+    # Parse
     try:
-        scanner = Scanner(config)
-        files_to_scan = list(scanner.scan())
-        print(f"Found {len(files_to_scan)} files to process.")
+        return parser.parse(file_path, content)
     except Exception as e:
-        logging.error(f"Scanning failed: {e}")
-        sys.exit(1)
+        logging.error(f"Error parsing {file_path}: {e}")
+        return []
 
+def run_static_scan(config):
+    # 2. Scanning + 3. Processing
+    # Discovery is streamed straight into the worker pool, so files are read and
+    # parsed while the tree is still being walked.
+    print("\n[Phase 1-2] Discovery & Analysis...")
+    scanner = Scanner(config)
     parser = Parser()
     all_findings = []
     
-    # 3. Processing
-    print("\n[Phase 2] Analysis...")
+    discovered_count = 0
     processed_count = 0
     start_time = time.time()
 
-    for file_path in files_to_scan:
-        processed_count += 1
-        
-        if processed_count % 10 == 0 or processed_count == len(files_to_scan):
-            sys.stdout.write(f"\rProcessing: {processed_count}/{len(files_to_scan)}")
-            sys.stdout.flush()
+    # Files are independent, so reads overlap across worker threads. Futures are
+    # drained in discovery order (bounded window) so reports stay deterministic.
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    window = max_workers * 4
+    pending = deque()
 
-        # Read
-        content, encoding = FileReader.read_file(file_path)
-        if content is None:
-            logging.warning(f"Skipping file {file_path}: {encoding}")
-            continue
+    # Console writes are throttled: every 100 files or 0.25s, whichever comes first.
+    # The total is the number of files discovered so far (final once the walk ends).
+    last_update = time.monotonic()
 
-        # Parse
+    def drain_one():
+        nonlocal processed_count, last_update
+        all_findings.extend(pending.popleft().result())
+        processed_count += 1
+        if processed_count % 100 == 0 or time.monotonic() - last_update > 0.25:
+            last_update = time.monotonic()
+            print(f"\rProcessing: {processed_count}/{discovered_count}", end="", flush=True)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
         try:
-            findings = parser.parse(file_path, content)
-            all_findings.extend(findings)
+            for file_path in scanner.scan():
+                discovered_count += 1
+                pending.append(executor.submit(process_file, parser, file_path))
+                if len(pending) >= window:
+                    drain_one()
         except Exception as e:
-            logging.error(f"Error parsing {file_path}: {e}")
+            logging.error(f"Scanning failed: {e}")
+            sys.exit(1)
+        while pending:
+            drain_one()
+
+    print(f"\rProcessing: {processed_count}/{discovered_count}", end="")
+    sys.stdout.flush()
+    print(f"\nFound {discovered_count} files to process.")
 
     duration = time.time() - start_time
     print(f"\n\nAnalysis complete in {duration:.2f} seconds.")
@@ -141,6 +171,8 @@ def run_static_scan(config):
             print("- Code_Inventory.xlsx")
             print("- Refactoring_Tracker.xlsx")
             print("- Crawler_Input.xlsx")
+            print("- Crawler_Input.csv")
+            print("- extracted_code.zip")
 
         except Exception as e:
             logging.error(f"Failed to generate report: {e}")
@@ -157,4 +189,6 @@ def run_extraction(config):
     pass
 
 if __name__ == "__main__":
+    # Required for the report process pool in frozen (PyInstaller) builds
+    multiprocessing.freeze_support()
     main()
@@ -1,8 +1,37 @@
 import os
 import re
+import sys
+import json
 import argparse
+import multiprocessing
 from openpyxl import Workbook
-from openpyxl.styles import PatternFill, Font, Alignment
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import PatternFill, Font, Alignment, NamedStyle
+
+# The --streaming backend (xlsxwriter constant_memory) is shared with the scanner's src/
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from src.xlsx_stream import StreamingCell, StreamingWorkbook, StreamingWorksheet, streaming_available
+
+try:
+    # Optional: google-re2 gives linear-time (DFA) matching for the detection patterns
+    import re2
+except ImportError:
+    re2 = None
+
+# Engine for patterns that stay within RE2 syntax (no lookaround/backreferences)
+_fast_re = re2 if re2 is not None else re
+
+# re's Unicode \s, spelled out: RE2's \s only matches ASCII whitespace
+_SPACE = '[\t\n\x0b\x0c\r\x1c-\x1f \x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000]'
+
+
+def _portable(pattern):
+    """
+    Rewrites a case-insensitive _fast_re pattern so RE2 matches exactly what re does:
+    whitespace classes become _SPACE, and 'i' also accepts the dotted and dotless forms
+    that re folds into it under (?i). Patterns that need Unicode word characters stay on re.
+    """
+    return pattern.replace(r'\s', _SPACE).replace('i', '[i\u0130\u0131]')
 
 # ============================================================================
 # MODULE 1: LOGIC & ASSESSMENT - Ternary Classification System
@@ -49,17 +78,80 @@ def parse_metadata(filename):
     Format: OriginalPath_Type_lineStart-End.ext
     Returns: (OriginalPath, LineRange, Type)
     """
+    # Match the standard format defined in the tool
+    # Example: Views_Home_Index.cshtml_scriptblock_line10-25.js
+    # Fixed grammar, so plain string splits from the right (no regex backtracking)
+    unknown = (filename, "Unknown", "Unknown", 0, 0)
+    # The old regex anchored with '$', which also matched before one trailing newline
+    name = filename[:-1] if filename.endswith('\n') else filename
+    stem, dot, ext = name.rpartition('.')
+    if not dot or ext not in ('js', 'css'):
+        return unknown
+    head, sep, lines = stem.rpartition('_line')
+    if not sep:
+        return unknown
+    start, dash, end = lines.partition('-')
+    if not (dash and start.isdecimal() and end.isdecimal()):
+        return unknown
+    sanitized, sep, code_type = head.rpartition('_')
+    if not (sep and sanitized and code_type.isascii() and code_type.isalnum()):
+        return unknown
+    orig_path = sanitized.replace('_', '/')
+    return orig_path, f"{start}-{end}", code_type, int(start), int(end)
+
+
+# Block metadata written next to the extracted files by the analyser (JSON lines)
+MANIFEST_NAME = "manifest.jsonl"
+
+
+def load_manifest(extracted_path):
+    """
+    Reads the analyser's manifest.jsonl, if present, into {file name: metadata} with
+    metadata shaped like parse_metadata()'s result. Returns {} when there is none.
+    """
+    manifest = {}
     try:
-        # Match the standard format defined in the tool
-        # Example: Views_Home_Index.cshtml_scriptblock_line10-25.js
-        match = re.search(r'(.+)_([a-zA-Z0-9]+)_line(\d+)-(\d+)\.(js|css)$', filename)
-        if match:
-            sanitized, code_type, start, end, ext = match.groups()
-            orig_path = sanitized.replace('_', '/')
-            return orig_path, f"{start}-{end}", code_type, int(start), int(end)
-    except:
+        with open(os.path.join(extracted_path, MANIFEST_NAME), encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                row = json.loads(line)
+                start, end = row['start_line'], row['end_line']
+                manifest[os.path.basename(row['extracted_file'])] = (
+                    row['source_path'], f"{start}-{end}", row['code_type'], start, end)
+    except FileNotFoundError:
         pass
-    return filename, "Unknown", "Unknown", 0, 0
+    except (OSError, ValueError, KeyError) as e:
+        print(f"[!] Ignoring unreadable {MANIFEST_NAME}: {e}")
+        return {}
+    return manifest
+
+
+# Control Flow Patterns (State C - Blocked), one case-insensitive alternation
+_CONTROL_FLOW_RE = _fast_re.compile('(?i)' + _portable(
+    r'@if\s*\(|@else|@foreach\s*\(|@for\s*\(|@while\s*\(|@switch\s*\(|@using\s*\('
+    r'|<%\s*if|<%\s*for|<%\s*while'
+))
+
+# Value/String Patterns (State B - Bridgeable), compiled once. Each pattern is run
+# separately and in this order, so token counts match the original per-pattern findall.
+# These stay on re: RE2's \w is ASCII-only, so @Model.Größe would become @Model.Gr.
+_VALUE_PATTERNS = tuple(re.compile(p) for p in (
+    r'@Url\.Action\([^)]+\)',
+    r'@Url\.Content\([^)]+\)',
+    r'@Model\.\w+',
+    r'@ViewBag\.\w+',
+    r'@ViewData\[[^\]]+\]',
+    r'@Html\.\w+',
+    r'<%=\s*[^%]+%>',
+))
+
+_AJAX_RE = _fast_re.compile('(?i)' + _portable(
+    r'\$\.ajax\s*\(|\$\.get\s*\(|\$\.post\s*\(|\.ajax\s*\(|fetch\s*\(|XMLHttpRequest\s*\(|\$http\.|axios\.'
+))
+
+# Literal fragments (lowercase) that every _AJAX_RE alternative contains
+_AJAX_HINTS = ('.ajax', '$.get', '$.post', 'fetch', 'xmlhttprequest', '$http.', 'axios.')
 
 
 def detect_razor_patterns(content):
@@ -71,40 +163,14 @@ def detect_razor_patterns(content):
     State B (Yellow): Razor syntax in strings/values (bridgeable)
     State C (Red): Razor control flow (blocked)
     """
-    # Control Flow Patterns (State C - Blocked)
-    control_flow_patterns = [
-        r'@if\s*\(',
-        r'@else',
-        r'@foreach\s*\(',
-        r'@for\s*\(',
-        r'@while\s*\(',
-        r'@switch\s*\(',
-        r'@using\s*\(',
-        r'<%\s*if',
-        r'<%\s*for',
-        r'<%\s*while'
-    ]
+    # Every Razor/ASP pattern starts with '@' or '<%'; most extracted files have neither
+    if '@' not in content and '<%' not in content:
+        return 'A', [], 'clean'
     
-    for pattern in control_flow_patterns:
-        if re.search(pattern, content, re.IGNORECASE):
-            return 'C', [], 'control_flow'
-    
-    # Value/String Patterns (State B - Bridgeable)
-    value_patterns = [
-        r'@Url\.Action\([^)]+\)',
-        r'@Url\.Content\([^)]+\)',
-        r'@Model\.\w+',
-        r'@ViewBag\.\w+',
-        r'@ViewData\[[^\]]+\]',
-        r'@Html\.\w+',
-        r'<%=\s*[^%]+%>'
-    ]
+    if _CONTROL_FLOW_RE.search(content):
+        return 'C', [], 'control_flow'
     
-    razor_tokens = []
-    for pattern in value_patterns:
-        matches = re.findall(pattern, content)
-        if matches:
-            razor_tokens.extend(matches)
+    razor_tokens = [token for pattern in _VALUE_PATTERNS for token in pattern.findall(content)]
     
     if razor_tokens:
         return 'B', razor_tokens, 'value_injection'
@@ -118,24 +184,14 @@ def detect_ajax_calls(content):
     Detects AJAX patterns in JavaScript code.
     Returns: True if AJAX call is found
     """
-    ajax_patterns = [
-        r'\$\.ajax\s*\(',
-        r'\$\.get\s*\(',
-        r'\$\.post\s*\(',
-        r'\.ajax\s*\(',
-        r'fetch\s*\(',
-        r'XMLHttpRequest\s*\(',
-        r'\$http\.',
-        r'axios\.'
-    ]
-    
-    for pattern in ajax_patterns:
-        if re.search(pattern, content, re.IGNORECASE):
-            return True
-    return False
+    # Cheap substring gate before the case-insensitive regex
+    lowered = content.lower()
+    if not any(hint in lowered for hint in _AJAX_HINTS):
+        return False
+    return _AJAX_RE.search(content) is not None
 
 
-def classify_code(filename, content, file_category):
+def classify_code(filename, content, file_category, razor=None, is_ajax=None):
     """
     Classifies code into State A/B/C with AJAX detection.
     
@@ -143,17 +199,26 @@ def classify_code(filename, content, file_category):
         filename: Name of the extracted file
         content: Code content
         file_category: 'internal' or 'inline'
+        razor: Precomputed detect_razor_patterns() result (optional)
+        is_ajax: Precomputed detect_ajax_calls() result (optional)
     
     Returns: (state, complexity, status, action, reason, razor_count, is_ajax)
     """
-    # Parse metadata
-    orig_path, lines, code_type, start_line, end_line = parse_metadata(filename)
-    
+    # Filename metadata is parsed once by the caller (analyze_folder); nothing here needs it
+
+    # Empty/whitespace-only snippets cannot hold Razor or AJAX; skip both detectors
+    if not content or content.isspace():
+        if razor is None:
+            razor = ('A', [], 'clean')
+        if is_ajax is None:
+            is_ajax = False
+
     # Detect Razor patterns
-    state, razor_tokens, pattern_type = detect_razor_patterns(content)
+    state, razor_tokens, pattern_type = razor if razor is not None else detect_razor_patterns(content)
     
     # Detect AJAX
-    is_ajax = detect_ajax_calls(content)
+    if is_ajax is None:
+        is_ajax = detect_ajax_calls(content)
     
     # CSS-specific handling
     if filename.endswith('.css'):
@@ -199,115 +264,288 @@ def classify_code(filename, content, file_category):
                 len(razor_tokens), is_ajax)
 
 
-def analyze_folder(folder_path, sheet, file_type, category, metrics):
+# Named styles used by the assessment sheets (colors are RGB hex)
+STYLE_SPECS = {
+    "assess_header": {'bold': True, 'color': "FFFFFF", 'fill': "4F81BD", 'horizontal': "center", 'vertical': "center"},
+    "assess_title": {'bold': True, 'size': 16, 'color': "FFFFFF", 'fill': "2F75B5", 'horizontal': "center", 'vertical': "center"},
+    "assess_metric_header": {'bold': True, 'color': "FFFFFF", 'fill': "4F81BD", 'horizontal': "center"},
+    "assess_index": {'bold': True, 'size': 14, 'color': "FFFFFF", 'fill': "70AD47"},
+    "assess_index_note": {'fill': "E2EFDA"},
+    # State column: fill + bold font; Status column: fill only
+    "state_blocked": {'bold': True, 'color': "9C0006", 'fill': "FFC7CE"},
+    "state_bridgeable": {'bold': True, 'color': "9C6500", 'fill': "FFEB9C"},
+    "state_ready": {'bold': True, 'color': "006100", 'fill': "C6EFCE"},
+    "status_blocked": {'fill': "FFC7CE"},
+    "status_bridgeable": {'fill': "FFEB9C"},
+    "status_ready": {'fill': "C6EFCE"},
+}
+
+
+def register_styles(wb):
+    """
+    Registers the named styles used by the assessment sheets (once per workbook).
+    Cells then reference a style by name instead of carrying their own style objects.
+    """
+    for name, spec in STYLE_SPECS.items():
+        style = NamedStyle(name)
+        if 'bold' in spec or 'color' in spec:
+            style.font = Font(bold=spec.get('bold', False), size=spec.get('size'), color=spec.get('color'))
+        if 'fill' in spec:
+            style.fill = PatternFill(start_color=spec['fill'], end_color=spec['fill'], fill_type="solid")
+        if 'horizontal' in spec:
+            style.alignment = Alignment(horizontal=spec['horizontal'], vertical=spec.get('vertical'))
+        wb.add_named_style(style)
+
+
+# State -> (State cell style, Status cell style)
+STATE_STYLES = {
+    'C': ("state_blocked", "status_blocked"),     # Blocked - Red
+    'B': ("state_bridgeable", "status_bridgeable"),  # Bridgeable - Yellow
+    'A': ("state_ready", "status_ready"),         # Ready - Green
+}
+
+
+def styled_cell(sheet, value, style):
+    if isinstance(sheet, StreamingWorksheet):
+        cell = StreamingCell(value)
+    else:
+        cell = WriteOnlyCell(sheet, value=value)
+    cell.style = style
+    return cell
+
+
+READ_CHUNK = 65536       # characters per read for large extracted files
+CHUNK_OVERLAP = 256      # carried between chunks so a match can straddle a boundary
+TRUNCATE_SIZE = 1048576  # files larger than this (bytes) are only read in part...
+TRUNCATE_PREFIX = 262144  # ...up to this many characters from the top
+
+
+def read_extracted(file_path, is_css):
+    """
+    Reads an extracted file for classification.
+    
+    Files up to READ_CHUNK bytes are read whole. Larger files are read in chunks and
+    reading stops once the outcome is fixed: a Razor control-flow match makes the file
+    Blocked (State C), after which only the AJAX flag of a JS file still depends on the
+    remaining text. Files over TRUNCATE_SIZE (typically minified vendor bundles) are
+    classified from their first TRUNCATE_PREFIX characters only.
+    
+    Returns: (content, blocked_ajax, truncated) - blocked_ajax is None unless the file
+    was found Blocked early, in which case content holds only the text read so far;
+    truncated is True when the size cap stopped reading.
+    """
+    with open(file_path, 'r', encoding='utf-8', errors='ignore', buffering=131072) as f:
+        size = os.fstat(f.fileno()).st_size
+        if size <= READ_CHUNK:
+            return f.read(), None, False
+        
+        limit = TRUNCATE_PREFIX if size > TRUNCATE_SIZE else None
+        parts = []
+        tail = ""
+        blocked = False
+        is_ajax = False
+        read = 0
+        while True:
+            if limit is not None and read >= limit:
+                break
+            chunk = f.read(READ_CHUNK)
+            if not chunk:
+                break
+            read += len(chunk)
+            window = tail + chunk
+            if not blocked:
+                parts.append(chunk)
+                if _CONTROL_FLOW_RE.search(window):
+                    blocked = True
+                    if is_css:
+                        break
+                    # AJAX may sit anywhere in the text read so far
+                    is_ajax = detect_ajax_calls("".join(parts))
+            elif not is_ajax:
+                is_ajax = detect_ajax_calls(window)
+            if blocked and is_ajax:
+                break
+            tail = window[-CHUNK_OVERLAP:]
+        
+        truncated = limit is not None and read >= limit
+        return "".join(parts), (is_ajax if blocked else None), truncated
+
+
+def _iter_files(folder_path):
+    """Yields file paths under folder_path in os.walk order, using the DirEntry paths."""
+    subdirs = []
+    try:
+        with os.scandir(folder_path) as it:
+            for entry in it:
+                if entry.is_dir():
+                    if not entry.is_symlink():
+                        subdirs.append(entry.path)
+                else:
+                    yield entry.path
+    except OSError:
+        return
+    for subdir in subdirs:
+        yield from _iter_files(subdir)
+
+
+POOL_MIN_FILES = 64      # below this a folder is classified in-process
+POOL_CHUNKSIZE = 32      # files handed to a worker per task
+
+
+class _LazyPool:
+    """
+    multiprocessing.Pool that is only started once a folder is large enough to need it.
+    The pool is sized to the folder's task chunks (capped at cpu_count) and restarted
+    bigger if a later folder has more work; small runs never spawn worker processes.
+    """
+    def __init__(self):
+        self._pool = None
+        self._size = 0
+    
+    def get(self, n_tasks):
+        size = min(os.cpu_count() or 1, -(-n_tasks // POOL_CHUNKSIZE))
+        if self._pool is None or size > self._size:
+            # The previous folder's results are fully consumed before the next one starts
+            self.close()
+            self._pool = multiprocessing.Pool(size)
+            self._size = size
+        return self._pool
+    
+    def close(self):
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+            self._size = 0
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        if self._pool is not None and exc[0] is not None:
+            self._pool.terminate()
+        self.close()
+
+
+def _classify_file(task):
+    """
+    Reads and classifies one extracted file (runs in a worker process).
+    
+    Args:
+        task: (file_path, category, metadata) tuple; metadata comes from the manifest,
+              or is None to parse it from the file name
+    
+    Returns: (file, None, (orig_path, lines, code_type, state, complexity, status,
+    action, reason, razor_count, is_ajax, snippet, truncated)), or (file, error, None)
+    if the file could not be read.
+    """
+    file_path, category, metadata = task
+    file = os.path.basename(file_path)
+    try:
+        content, blocked_ajax, truncated = read_extracted(file_path, file.endswith('.css'))
+    except Exception as e:
+        return file, e, None
+    
+    # Parse Metadata
+    orig_path, lines, code_type, start_line, end_line = metadata or parse_metadata(file)
+    
+    # Classify (files found Blocked while reading skip re-detection)
+    if blocked_ajax is None:
+        result = classify_code(file, content, category)
+    else:
+        result = classify_code(file, content, category, razor=('C', [], 'control_flow'), is_ajax=blocked_ajax)
+    state, complexity, status, action, reason, razor_count, is_ajax = result
+    
+    # Create snippet
+    snippet = content[:150].replace('\n', ' ').strip()
+    
+    return file, None, (orig_path, lines, code_type, state, complexity, status,
+                        action, reason, razor_count, is_ajax, snippet, truncated)
+
+
+def analyze_folder(folder_path, sheet, file_type, category, metrics, pool=None, manifest=None):
     """
     Scans a folder and populates the Excel sheet with enhanced metadata.
+    Rows are streamed with append(), so the sheet may be a write-only worksheet.
     
     Args:
         folder_path: Path to the folder to analyze
-        sheet: Excel worksheet object
+        sheet: Excel worksheet object (styles from register_styles)
         file_type: 'JS' or 'CSS'
         category: 'internal' or 'inline'
         metrics: Dictionary to track refactorability metrics
+        pool: _LazyPool used to classify larger folders (optional)
+        manifest: load_manifest() result; files it lists skip file-name parsing (optional)
     """
+    # Column widths (must be set before any row is written in write-only mode)
+    widths = [35, 12, 15, 12, 8, 12, 15, 30, 45, 12, 8, 50, 10]
+    for i, width in enumerate(widths, 1):
+        sheet.column_dimensions[chr(64+i)].width = width
+    
     # Enhanced Header
     headers = ["Original File", "Lines", "Code Type", "Category", "State", 
                "Complexity", "Status", "Action", "Reason", "Razor Tokens", 
-               "AJAX", "Snippet"]
-    sheet.append(headers)
-    
-    # Style Header
-    for cell in sheet[1]:
-        cell.font = Font(bold=True, color="FFFFFF")
-        cell.fill = PatternFill(start_color="4F81BD", end_color="4F81BD", fill_type="solid")
-        cell.alignment = Alignment(horizontal="center", vertical="center")
-    
-    # Auto-adjust column widths
-    widths = [35, 12, 15, 12, 8, 12, 15, 30, 45, 12, 8, 50]
-    for i, width in enumerate(widths, 1):
-        sheet.column_dimensions[chr(64+i)].width = width
+               "AJAX", "Snippet", "Truncated"]
+    sheet.append([styled_cell(sheet, h, "assess_header") for h in headers])
     
     if not os.path.exists(folder_path):
         return
     
-    for root, _, files in os.walk(folder_path):
-        for file in files:
-            file_path = os.path.join(root, file)
-            try:
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-            except Exception as e:
-                print(f"Error reading {file}: {e}")
-                continue
-            
-            # Parse Metadata
-            orig_path, lines, code_type, start_line, end_line = parse_metadata(file)
-            
-            # Classify
-            state, complexity, status, action, reason, razor_count, is_ajax = classify_code(file, content, category)
-            
-            # Update metrics
-            metrics['total'] += 1
-            if state == 'A':
-                metrics['clean'] += 1
-            elif state == 'B':
-                metrics['bridge'] += 1
-            if category == 'inline' and state in ['A', 'B']:
-                metrics['inline'] += 1
-            
-            # Create snippet
-            snippet = content[:150].replace('\n', ' ').strip()
-            
-            # Build row
-            row = [orig_path, lines, code_type, category, state, complexity, 
-                   status, action, reason, razor_count, 
-                   "Yes" if is_ajax else "No", snippet]
-            sheet.append(row)
-            
-            # Color coding based on State
-            row_idx = sheet.max_row
-            state_cell = sheet.cell(row=row_idx, column=5)
-            status_cell = sheet.cell(row=row_idx, column=7)
-            
-            if state == 'C':  # Blocked - Red
-                fill = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
-                font = Font(color="9C0006", bold=True)
-            elif state == 'B':  # Bridgeable - Yellow
-                fill = PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid")
-                font = Font(color="9C6500", bold=True)
-            else:  # Ready - Green
-                fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
-                font = Font(color="006100", bold=True)
-            
-            state_cell.fill = fill
-            state_cell.font = font
-            status_cell.fill = fill
-
-
-def create_summary_sheet(wb, metrics):
+    manifest = manifest or {}
+    tasks = [(file_path, category, manifest.get(os.path.basename(file_path)))
+             for file_path in _iter_files(folder_path)]
+    
+    # Classification runs in the workers; the sheet is only written here.
+    # imap keeps os.walk order so reports stay comparable between runs.
+    if pool is not None and len(tasks) >= POOL_MIN_FILES:
+        results = pool.get(len(tasks)).imap(_classify_file, tasks, chunksize=POOL_CHUNKSIZE)
+    else:
+        results = map(_classify_file, tasks)
+    
+    for file, error, result in results:
+        if error is not None:
+            print(f"Error reading {file}: {error}")
+            continue
+        (orig_path, lines, code_type, state, complexity, status,
+         action, reason, razor_count, is_ajax, snippet, truncated) = result
+        
+        # Update metrics
+        metrics['total'] += 1
+        if state == 'A':
+            metrics['clean'] += 1
+        elif state == 'B':
+            metrics['bridge'] += 1
+        if category == 'inline' and state in ['A', 'B']:
+            metrics['inline'] += 1
+        
+        # Build row; State and Status are color coded through the named styles
+        state_style, status_style = STATE_STYLES.get(state, STATE_STYLES['A'])
+        row = [orig_path, lines, code_type, category, styled_cell(sheet, state, state_style), complexity, 
+               styled_cell(sheet, status, status_style), action, reason, razor_count, 
+               "Yes" if is_ajax else "No", snippet, "Yes" if truncated else "No"]
+        sheet.append(row)
+
+
+def create_summary_sheet(ws, metrics):
     """
-    Creates a summary sheet with KPI and Refactorability Index.
+    Fills the summary sheet with KPI and Refactorability Index.
+    The sheet is created first (so it is the first tab) and filled once metrics are known.
     """
-    ws = wb.create_sheet("Summary & KPIs", 0)
+
+    # Column widths
+    ws.column_dimensions['A'].width = 30
+    ws.column_dimensions['B'].width = 15
+    ws.column_dimensions['C'].width = 10
+    ws.column_dimensions['D'].width = 50
     
     # Title
-    ws.merge_cells('A1:D1')
-    title_cell = ws['A1']
-    title_cell.value = "Refactoring Assessment - Summary Report"
-    title_cell.font = Font(bold=True, size=16, color="FFFFFF")
-    title_cell.fill = PatternFill(start_color="2F75B5", end_color="2F75B5", fill_type="solid")
-    title_cell.alignment = Alignment(horizontal="center", vertical="center")
     ws.row_dimensions[1].height = 30
+    ws.append([styled_cell(ws, "Refactoring Assessment - Summary Report", "assess_title")])
+    ws.merged_cells.add('A1:D1')
     
     # Metrics
     ws.append([])
-    ws.append(["Metric", "Count", "Weight", "Description"])
-    
-    # Style metrics header
-    for cell in ws[3]:
-        cell.font = Font(bold=True, color="FFFFFF")
-        cell.fill = PatternFill(start_color="4F81BD", end_color="4F81BD", fill_type="solid")
-        cell.alignment = Alignment(horizontal="center")
+    ws.append([styled_cell(ws, h, "assess_metric_header") for h in ["Metric", "Count", "Weight", "Description"]])
     
     # Data rows
     data = [
@@ -327,54 +565,53 @@ def create_summary_sheet(wb, metrics):
     else:
         refactor_percentage = 0
     
-    # Add formula row
+    # Add formula row (styled as it is written)
     ws.append([])
-    ws.append(["Refactorability Index", f"{refactor_percentage:.2f}%", "", 
-               "Weighted success rate of auto-refactoring"])
-    
-    # Style the index row
-    index_row = ws.max_row
-    ws.cell(index_row, 1).font = Font(bold=True, size=14, color="FFFFFF")
-    ws.cell(index_row, 1).fill = PatternFill(start_color="70AD47", end_color="70AD47", fill_type="solid")
-    ws.cell(index_row, 2).font = Font(bold=True, size=14, color="FFFFFF")
-    ws.cell(index_row, 2).fill = PatternFill(start_color="70AD47", end_color="70AD47", fill_type="solid")
-    ws.cell(index_row, 4).fill = PatternFill(start_color="E2EFDA", end_color="E2EFDA", fill_type="solid")
-    
-    # Column widths
-    ws.column_dimensions['A'].width = 30
-    ws.column_dimensions['B'].width = 15
-    ws.column_dimensions['C'].width = 10
-    ws.column_dimensions['D'].width = 50
+    ws.append([styled_cell(ws, "Refactorability Index", "assess_index"),
+               styled_cell(ws, f"{refactor_percentage:.2f}%", "assess_index"), "",
+               styled_cell(ws, "Weighted success rate of auto-refactoring", "assess_index_note")])
     
     return refactor_percentage
 
 
-def generate_report(extracted_path, output_path):
+def generate_report(extracted_path, output_path, streaming=False):
     """
     Generates the enhanced Refactoring Assessment Excel report.
+    With streaming=True the workbook is written by xlsxwriter in constant_memory mode.
     """
     # Validate directory structure first
     validate_directory_structure(extracted_path)
     
-    wb = Workbook()
-    wb.remove(wb.active)  # Remove default sheet
+    if streaming and not streaming_available():
+        print("[!] --streaming needs xlsxwriter (pip install xlsxwriter). Using openpyxl.")
+        streaming = False
+    
+    if streaming:
+        wb = StreamingWorkbook(output_path)
+    else:
+        # Write-only workbook: rows stream to disk instead of living in the cell dict
+        wb = Workbook(write_only=True)
+    register_styles(wb)
+    summary_ws = wb.create_sheet("Summary & KPIs")
     
     # Initialize metrics tracker
     metrics = {'total': 0, 'clean': 0, 'bridge': 0, 'inline': 0}
     
-    # JavaScript Sheet
-    ws_js = wb.active
-    ws_js.title = "JavaScript Assessment"
-    js_path = os.path.join(extracted_path, "inline_javascript")
-    analyze_folder(js_path, ws_js, "JS")
-    
-    # CSS Inline (Attributes)
-    ws_css_inl = wb.create_sheet("CSS - Inline Styles")
-    css_inl_path = os.path.join(extracted_path, "css", "inline")
-    analyze_folder(css_inl_path, ws_css_inl, "CSS", "inline", metrics)
+    # One sheet per validated folder: (sheet title, sub-path, file type, category)
+    sheets = [
+        ("JS - Script Blocks", ('js', 'internal'), "JS", "internal"),
+        ("JS - Inline Handlers", ('js', 'inline'), "JS", "inline"),
+        ("CSS - Style Blocks", ('css', 'internal'), "CSS", "internal"),
+        ("CSS - Inline Styles", ('css', 'inline'), "CSS", "inline"),
+    ]
+    manifest = load_manifest(extracted_path)
+    with _LazyPool() as pool:
+        for title, sub_path, file_type, category in sheets:
+            ws = wb.create_sheet(title)
+            analyze_folder(os.path.join(extracted_path, *sub_path), ws, file_type, category, metrics, pool, manifest)
     
     # Create Summary Sheet
-    refactor_percentage = create_summary_sheet(wb, metrics)
+    refactor_percentage = create_summary_sheet(summary_ws, metrics)
     
     # Save
     try:
@@ -400,6 +637,8 @@ def main():
                         help="Path to 'extracted_code' folder")
     parser.add_argument("--output", required=False, 
                         help="Path for the output Excel file (default: parent of extracted folder)")
+    parser.add_argument("--streaming", action="store_true",
+                        help="Write the report with xlsxwriter in constant-memory mode (needs xlsxwriter)")
     
     args = parser.parse_args()
     
@@ -409,7 +648,7 @@ def main():
         args.output = os.path.join(parent_dir, "Refactoring_Assessment.xlsx")
     
     try:
-        generate_report(args.extracted, args.output)
+        generate_report(args.extracted, args.output, args.streaming)
     except DirectoryStructureError as e:
         print(f"\n[X] Directory Structure Error:\n{e}\n")
         exit(1)
@@ -419,4 +658,5 @@ def main():
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     main()
@@ -1,8 +1,32 @@
 import os
 import re
+import bisect
 import shutil
+import hashlib
+import functools
 import argparse
-import shutil
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from bs4 import BeautifulSoup
+
+try:
+    # Optional: enables --parser lxml (faster parsing of large pages)
+    import lxml
+except ImportError:
+    lxml = None
+
+# Extracted filename: path_to_file_type_lineStart-End.ext
+_EXTRACTED_RE = re.compile(r'(.+)_([a-zA-Z0-9]+)_line(\d+)-(\d+)\.(js|css)\Z')
+
+# Build output, dependency and tooling folders (config.ini's default exclude_folders).
+# The scanner never extracts from them, so they hold no pages to refactor or match.
+SKIP_DIRS = frozenset({'bin', 'obj', 'packages', 'node_modules', '.git', '.vs', '.idea', 'App_Data'})
+
+# Path separators folded to '_' by the extractor's sanitization, applied in one pass
+_SEP_TRANS = str.maketrans({os.sep: '_', '/': '_', '\\': '_'})
+
+# Razor control flow in a script block (State C - manual refactor); @for also covers @foreach
+_CONTROL_FLOW_RE = re.compile(r'@(?:if|for|while)')
 
 def parse_extracted_filename(filename):
     """
@@ -10,9 +34,13 @@ def parse_extracted_filename(filename):
     format: path_to_file_type_lineStart-End.ext
     example: Views_Home_Index.cshtml_scriptblock_line10-25.js
     """
+    # Cheap rejection before the regex: every extracted file is .js/.css with a _line range
+    if not filename.endswith(('.js', '.css')) or '_line' not in filename:
+        return None
+    
     try:
         # Regex to find the _lineX-Y part
-        match = re.search(r'(.+)_([a-zA-Z0-9]+)_line(\d+)-(\d+)\.(js|css)$', filename)
+        match = _EXTRACTED_RE.search(filename)
         if not match:
             return None
             
@@ -36,29 +64,75 @@ def parse_extracted_filename(filename):
         print(f"Error parsing {filename}: {e}")
         return None
 
-def find_original_file(root_dir, sanitized_path):
+def build_path_index(root_dir):
+    """
+    Walks root_dir once and returns (by_name, reversed_names) for find_original_file:
+    by_name maps each sanitized relative path to its rel_paths in walk order,
+    reversed_names holds the sanitized paths reversed and sorted, so every path ending
+    with a given suffix sits in one contiguous, bisectable run.
+    """
+    by_name = {}
+    
+    def walk(path, rel_prefix):
+        # os.walk order (a folder's files, then its sub-folders); relative paths are
+        # built from the names on the way down instead of os.path.relpath per file
+        subdirs = []
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    if entry.is_dir():
+                        if not entry.is_symlink() and entry.name not in SKIP_DIRS:
+                            subdirs.append(entry)
+                        continue
+                    rel_path = rel_prefix + entry.name
+                    
+                    # Simulate sanitization
+                    test_sanitized = rel_path.translate(_SEP_TRANS)
+                    
+                    by_name.setdefault(test_sanitized, []).append(rel_path)
+        except OSError:
+            return
+        for entry in subdirs:
+            walk(entry.path, rel_prefix + entry.name + os.sep)
+    
+    walk(root_dir, "")
+    reversed_names = sorted(name[::-1] for name in by_name)
+    return by_name, reversed_names
+
+# The source tree is not modified during a run, so one index per root is enough
+_cached_path_index = functools.lru_cache(maxsize=None)(build_path_index)
+
+def find_original_file(root_dir, sanitized_path, path_index=None):
     """
     Attempts to find the original file matching the sanitized path.
     Supports exact match and suffix match (to handle Root folder varying depth).
+    Pass a build_path_index() result to resolve against a specific snapshot; without
+    one the index for root_dir is built on first use and reused afterwards.
     """
+    by_name, reversed_names = path_index if path_index is not None else _cached_path_index(root_dir)
+    
+    matches = by_name.get(sanitized_path)
+    if matches:
+        return matches[0]
+    
+    # Fuzzy: Check if one assumes the other is a subpath
+    # e.g. Scan was "Views_File", Refactor sees "Project_Views_File"
     candidates = []
     
-    for root, dirs, files in os.walk(root_dir):
-        for file in files:
-            # Construct relative path
-            full_path = os.path.join(root, file)
-            rel_path = os.path.relpath(full_path, root_dir)
-            
-            # Simulate sanitization
-            test_sanitized = rel_path.replace(os.sep, "_").replace("/", "_").replace("\\", "_")
-            
-            if test_sanitized == sanitized_path:
-                return rel_path
-                
-            # Fuzzy: Check if one assumes the other is a subpath
-            # e.g. Scan was "Views_File", Refactor sees "Project_Views_File"
-            if test_sanitized.endswith(sanitized_path) or sanitized_path.endswith(test_sanitized):
-                candidates.append(rel_path)
+    # Files whose sanitized path ends with the query: one run of the reversed, sorted names
+    reversed_query = sanitized_path[::-1]
+    i = bisect.bisect_left(reversed_names, reversed_query)
+    while i < len(reversed_names) and reversed_names[i].startswith(reversed_query):
+        candidates.extend(by_name[reversed_names[i][::-1]])
+        if len(candidates) > 1:
+            return None
+        i += 1
+    
+    # Files whose sanitized path is a suffix of the query
+    for start in range(1, len(sanitized_path)):
+        candidates.extend(by_name.get(sanitized_path[start:], ()))
+        if len(candidates) > 1:
+            return None
 
     # If exactly one fuzzy candidate, return it
     if len(candidates) == 1:
@@ -66,46 +140,156 @@ def find_original_file(root_dir, sanitized_path):
         
     return None
 
-def main():
-    parser = argparse.ArgumentParser(description="Generate refactored copies of source files.")
-    parser.add_argument("--root", required=True, help="Root directory of the original source code")
-    parser.add_argument("--extracted", required=True, help="Path to the 'extracted_code' folder")
-    parser.add_argument("--output", required=True, help="Directory to save refactored copies")
+# Bridge Pattern naming: window.<BRIDGE_VAR_PREFIX><hash> holds a block's Razor values,
+# ID_PREFIX names elements that needed an id for addEventListener
+BRIDGE_VAR_PREFIX = "rsBridge_"
+ID_PREFIX = "rs-inline-"
+
+# Inline event attributes moved to addEventListener wrappers, in processing order
+INLINE_EVENTS = ('onclick', 'onload', 'onmouseover', 'onsubmit')
+
+# Razor value tokens moved out by the Bridge Pattern (State B): the value patterns that
+# check.py's detect_razor_patterns reports as bridgeable, so a block is bridged exactly
+# where the assessment says it can be. Optional surrounding quotes are captured so a
+# quoted token is replaced together with its quotes (the config keeps the value quoted).
+_RAZOR_VALUE_RE = re.compile(
+    r'([\'"]?)'
+    r'(@Url\.Action\([^)]+\)'
+    r'|@Url\.Content\([^)]+\)'
+    r'|@Model\.\w+'
+    r'|@ViewBag\.\w+'
+    r'|@ViewData\[[^\]]+\]'
+    r'|@Html\.\w+'
+    r'|<%=\s*[^%]+%>)'
+    r'\1'
+)
+
+# Generated views repeat the same inline handlers many times; hash each distinct text once
+@functools.lru_cache(maxsize=8192)
+def generate_hash(text):
+    """Short, stable id for generated file names and bridge variables."""
+    return hashlib.md5(text.encode('utf-8')).hexdigest()[:8]
+
+def create_bridge_config(content, file_hash):
+    """
+    Bridge Pattern: moves Razor value expressions out of a script block.
+    Each distinct token becomes a key on window.<BRIDGE_VAR_PREFIX><file_hash>; the
+    server still renders the values, now inside the config script left in the page.
+    Returns: (clean_js, bridge_config) - bridge_config is empty if nothing was found
+    """
+    bridge_config = {}
+    keys = {}
+    bridge_var = f"window.{BRIDGE_VAR_PREFIX}{file_hash}"
     
-    args = parser.parse_args()
+    def replace(match):
+        token = match.group(2)
+        key = keys.get(token)
+        if key is None:
+            key = keys[token] = f"val{len(keys)}"
+            bridge_config[key] = token
+        return f"{bridge_var}.{key}"
+    
+    clean_js = _RAZOR_VALUE_RE.sub(replace, content)
+    return clean_js, bridge_config
 
-    # Validate Input
-    if not os.path.exists(args.root):
-        print(f"Error: The root directory '{args.root}' does not exist. Please check the path.")
-        return
+PAGE_EXTENSIONS = ('.cshtml', '.html', '.aspx')
 
-    # 1. Copy Codebase to Output
-    print(f"Creating refactored copy at: {args.output}")
-    if os.path.exists(args.output):
-        try:
-            # Helper to delete read-only files (like .git objects)
-            import stat
-            def remove_readonly(func, path, excinfo):
-                os.chmod(path, stat.S_IWRITE)
-                func(path)
-                
-            shutil.rmtree(args.output, onerror=remove_readonly)
-        except Exception as e:
-            print(f"Error cleaning output/destination {args.output}: {e}")
-            return
+def mirror_tree(src, dst):
+    """
+    Snapshots src into dst. Files are hard-linked where the filesystem allows it, so
+    untouched files cost an inode entry instead of a byte copy; anything rewritten
+    later must go through write_new_file() so the original is never modified.
+    Returns the dst paths of the pages to refactor, collected during the copy so the
+    output tree does not have to be walked again. Everything is copied, but pages
+    under SKIP_DIRS are not returned.
+    """
+    pages = []
+    
+    def mirror(copy_file):
+        def copy(src_file, dst_file):
+            result = copy_file(src_file, dst_file)
+            if (dst_file.lower().endswith(PAGE_EXTENSIONS)
+                    and SKIP_DIRS.isdisjoint(dst_file[len(dst):].split(os.sep))):
+                pages.append(dst_file)
+            return result
+        return copy
+    
+    try:
+        shutil.copytree(src, dst, copy_function=mirror(os.link))
+    except (OSError, shutil.Error):
+        # Cross-device or no hardlink support: fall back to a plain copy
+        shutil.rmtree(dst, ignore_errors=True)
+        pages.clear()
+        shutil.copytree(src, dst, copy_function=mirror(shutil.copy2))
+    return pages
 
+def write_new_file(path, text):
+    """Writes text to path as a new inode (breaking any hardlink to the source tree)."""
     try:
-        shutil.copytree(args.root, args.output)
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+# Output folders already created in this run
+_created_dirs = set()
+
+def write_js_file(path, text):
+    """
+    Writes a generated JS file with a single os.write of its UTF-8 bytes, skipping the
+    text-IO layer. Like write_new_file, an existing file is unlinked first.
+    """
+    folder = os.path.dirname(path)
+    if folder not in _created_dirs:
+        os.makedirs(folder, exist_ok=True)
+        _created_dirs.add(folder)
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+    data = memoryview(text.encode('utf-8'))
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+def process_file(file_path, extracted_root, output_root, parser='html.parser'):
+    """
+    Refactors one HTML/Razor page in the output copy: script blocks with Razor values
+    are externalized through the Bridge Pattern, blocks with Razor control flow get a
+    TODO marker, and inline event handlers are moved to addEventListener wrappers.
+    parser is the BeautifulSoup tree builder ('html.parser' or 'lxml').
+    """
+    try:
+        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+            soup = BeautifulSoup(f.read(), parser)
     except Exception as e:
         print(f"Failed to read {file_path}: {e}")
         return
 
     modified = False
-    file_rel_path = os.path.basename(file_path) # Simplified matching
+    file_rel_path = os.path.relpath(file_path, output_root)
+    # Generated names carry the sanitized relative path: pages sharing a basename
+    # (Views/Home/Index.cshtml, Views/Admin/Index.cshtml) no longer collide
+    file_prefix = file_rel_path.translate(_SEP_TRANS)
+    internal_dir = os.path.join(output_root, "js", "internal") + os.sep
+    inline_dir = os.path.join(output_root, "js", "inline") + os.sep
+
+    # One walk over the tree collects both the script blocks and the tags carrying
+    # inline handlers; the edits below only touch these lists
+    scripts = []
+    handler_tags = []
+    for tag in soup.find_all(True):
+        if tag.name == 'script':
+            scripts.append(tag)
+        if not tag.attrs.keys().isdisjoint(INLINE_EVENTS):
+            handler_tags.append(tag)
 
     # --- 1. HANDLE INTERNAL SCRIPTS (BLOCKS) ---
     # We iterate over the ACTUAL script tags in the file and try to process them
-    scripts = soup.find_all('script')
     for script in scripts:
         if script.get('src'): continue 
         if not script.string: continue
@@ -116,7 +300,7 @@ def main():
         has_razor = '@' in content
         if not has_razor: continue # State A (Already handled by extractor, or ignored)
 
-        if re.search(r'(@if|@foreach|@for|@while)', content):
+        if _CONTROL_FLOW_RE.search(content):
             # State C: Add TODO
             comment = soup.new_string(f" TODO: Manual Refactor Required (State C) ")
             script.insert_before(comment)
@@ -128,41 +312,37 @@ def main():
         
         if bridge_config:
             # Save External File
-            new_filename = f"{file_rel_path}_script_{file_hash}.js"
-            js_out_path = os.path.join(output_root, "js", "internal", new_filename)
-            os.makedirs(os.path.dirname(js_out_path), exist_ok=True)
-            
-            with open(js_out_path, 'w', encoding='utf-8') as f:
-                f.write(clean_js)
+            new_filename = f"{file_prefix}_script_{file_hash}.js"
+            js_out_path = internal_dir + new_filename
+            write_js_file(js_out_path, clean_js)
             
             # Update HTML
             # 1. Inject Config
             config_script = soup.new_tag("script")
-            config_js = f"window.{BRIDGE_VAR_PREFIX}{file_hash} = {{\n"
-            for k, v in bridge_config.items():
-                config_js += f"    {k}: '{v}',\n" # Razor stays in quotes in the config
-            config_js += "};"
+            config_lines = [f"window.{BRIDGE_VAR_PREFIX}{file_hash} = {{"]
+            config_lines.extend(f"    {k}: '{v}'," for k, v in bridge_config.items()) # Razor stays in quotes in the config
+            config_lines.append("};")
+            config_js = "\n".join(config_lines)
             config_script.string = config_js
-            script.insert_before(config_script)
             
             # 2. Replace Block with Src
-            # FIX: Create new tag and replace_with
+            # Config and src tags go in with one replace_with (a single re-link of the tree)
             new_script = soup.new_tag("script", src=f"/js/internal/{new_filename}")
-            script.replace_with(new_script)
+            script.replace_with(config_script, new_script)
             modified = True
             print(f"[Fixed] Extracted Script Block in {file_rel_path}")
 
     # --- 2. HANDLE INLINE HANDLERS (ATTRIBUTES) ---
     # We look for standard event attributes
-    events = ['onclick', 'onload', 'onmouseover', 'onsubmit']
-    all_tags = soup.find_all(True)
-    
-    bottom_scripts = []
+    # Every wrapper of the page goes into one bundle, loaded by a single script tag
+    inline_wrappers = []
     
-    for tag in all_tags:
-        for evt in events:
+    for tag in handler_tags:
+        if tag.parent is None: continue # Script block replaced above
+        for evt in INLINE_EVENTS:
             if tag.has_attr(evt):
                 inline_code = tag[evt]
+                code_hash = generate_hash(inline_code)
                 # We classify this. If it has Razor, we skip (State C) or process.
                 # For v2.1, we treat all inline as candidates for extraction.
                 
@@ -170,14 +350,10 @@ def main():
                 if tag.has_attr('id'):
                     elem_id = tag['id']
                 else:
-                    elem_id = f"{ID_PREFIX}{generate_hash(inline_code)}"
+                    elem_id = f"{ID_PREFIX}{code_hash}"
                     tag['id'] = elem_id
                 
                 # 2. Extract Code
-                new_filename = f"{file_rel_path}_{evt}_{generate_hash(inline_code)}.js"
-                js_out_path = os.path.join(output_root, "js", "inline", new_filename)
-                os.makedirs(os.path.dirname(js_out_path), exist_ok=True)
-                
                 # Wrapper Logic
                 wrapper_js = f"""
 document.addEventListener('DOMContentLoaded', function() {{
@@ -189,50 +365,88 @@ document.addEventListener('DOMContentLoaded', function() {{
     }}
 }});
 """
-                with open(js_out_path, 'w', encoding='utf-8') as f:
-                    f.write(wrapper_js)
+                inline_wrappers.append(wrapper_js)
                 
                 # 3. Clean HTML
                 del tag[evt] # REMOVE the attribute
-                bottom_scripts.append(f"/js/inline/{new_filename}")
                 modified = True
                 print(f"[Fixed] Extracted Inline {evt} in {file_rel_path}")
 
-    # Inject Inline Script References at Body End
-    if bottom_scripts:
+    # Write the bundle and reference it at Body End
+    if inline_wrappers:
+        new_filename = f"{file_prefix}_inline.js"
+        write_js_file(inline_dir + new_filename, "".join(inline_wrappers))
         target = soup.body if soup.body else soup
-        for src in bottom_scripts:
-            s_tag = soup.new_tag("script", src=src)
-            target.append(s_tag)
+        target.append(soup.new_tag("script", src=f"/js/inline/{new_filename}"))
 
     if modified:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(str(soup.prettify()))
+        write_new_file(file_path, str(soup))
+
+POOL_MIN_PAGES = 16      # below this pages are refactored in-process
+POOL_CHUNKSIZE = 8       # pages handed to a worker per task
 
 def main():
     parser = argparse.ArgumentParser(description="Refactoring Engine v2.1 (Hotfix)")
     parser.add_argument("--root", required=True, help="Root of original code")
     parser.add_argument("--extracted", required=True, help="Extracted code directory")
     parser.add_argument("--output", required=True, help="Destination")
+    parser.add_argument("--parser", choices=("html.parser", "lxml"), default="html.parser",
+                        help="HTML parser; lxml is faster but wraps partial views in <html><body>")
     
     args = parser.parse_args()
     
+    if args.parser == "lxml" and lxml is None:
+        print("[!] --parser lxml needs lxml (pip install lxml). Using html.parser.")
+        args.parser = "html.parser"
+    
+    cleaner = None
+    stale = None
     if os.path.exists(args.output):
+        # Move the previous output aside (a single rename) and delete it in a separate
+        # process while the new copy is built and refactored
+        stale = f"{os.path.normpath(args.output)}.old-{os.getpid()}"
         try:
-            shutil.rmtree(args.output)
-        except:
-            pass # Handle permission errors gracefully
+            os.rename(args.output, stale)
+        except OSError:
+            stale = None # Could not be moved (e.g. a file held open on Windows)
+        if stale is None:
+            try:
+                shutil.rmtree(args.output)
+            except OSError as e:
+                # The mirror cannot be created over a partly deleted output
+                print(f"Error cleaning output/destination {args.output}: {e}")
+                return
+        else:
+            # The cleaner ignores errors; whatever it leaves behind is reported at the end
+            cleaner = multiprocessing.Process(target=shutil.rmtree, args=(stale,),
+                                              kwargs={'ignore_errors': True})
+            try:
+                cleaner.start()
+            except OSError:
+                cleaner = None
             
-    shutil.copytree(args.root, args.output)
+    _created_dirs.clear() # The output tree was just removed
+    pages = mirror_tree(args.root, args.output)
     print(f"[Init] Copied codebase to {args.output}")
 
-    for root, dirs, files in os.walk(args.output):
-        for file in files:
-            if file.lower().endswith(('.cshtml', '.html', '.aspx')):
-                full_path = os.path.join(root, file)
-                process_file(full_path, args.extracted, args.output)
+    # Pages are independent and each writes only its own JS files (named after the
+    # page), so they can be parsed in parallel without coordination
+    refactor_page = functools.partial(process_file, extracted_root=args.extracted,
+                                      output_root=args.output, parser=args.parser)
+    if len(pages) >= POOL_MIN_PAGES:
+        with ProcessPoolExecutor() as executor:
+            for _ in executor.map(refactor_page, pages, chunksize=POOL_CHUNKSIZE):
+                pass
+    else:
+        for full_path in pages:
+            refactor_page(full_path)
     
+    if cleaner is not None:
+        cleaner.join()
+    if stale is not None and os.path.exists(stale):
+        print(f"[!] Could not delete the previous output (moved to {stale}); remove it manually.")
     print("\n[Done] Refactoring Complete.")
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     main()
@@ -3,10 +3,16 @@ import os
 import sys
 import time
 from datetime import datetime
-from src.scanner import Scanner
-from src.reporter import Reporter
 
-def get_banner():
+# Inventory columns totalled for the completion summary
+SUMMED_COLUMNS = (
+    'Line_Count', 'Size_KB',
+    'Inline_CSS_Count', 'Inline_JS_Count',
+    'Internal_Style_Blocks_Count', 'Internal_Script_Blocks_Count',
+    'External_Stylesheet_Links_Count', 'External_Script_Tags_Count',
+)
+
+def _build_banner():
     """Generate professional branded banner string"""
     width = 80
     # ASCII Art for "RepoScan"
@@ -30,35 +36,49 @@ def get_banner():
     banner.append("=" * width)
     return "\n".join(banner)
 
-def print_footer(summary_stats, output_file, header_info=""):
-    """Display completion footer with summary and save full execution log to text file"""
-    
-    summary_text = f"""
-{'=' * 66}
+# The banner never changes; build it once at import
+_BANNER = _build_banner()
+
+def get_banner():
+    """Return the branded banner string"""
+    return _BANNER
+
+# Completion footer; filled from summary_stats (missing counts default to 0)
+_FOOTER_TMPL = """
+==================================================================
            Castellum Labs RepoScan - Analysis Complete
-{'=' * 66}
+==================================================================
 
 SCAN SUMMARY:
-{'-' * 66}
-  Total Files Scanned:      {summary_stats.get('total_files', 0):,}
-  Total Directories:        {summary_stats.get('total_dirs', 0):,}
-  Total File Size:          {summary_stats.get('total_size_mb', 0):.2f} MB
-  Lines of Code:            {summary_stats.get('total_lines', 0):,}
+------------------------------------------------------------------
+  Total Files Scanned:      {total_files:,}
+  Total Directories:        {total_dirs:,}
+  Total File Size:          {total_size_mb:.2f} MB
+  Lines of Code:            {total_lines:,}
 
-  AJAX Calls Detected:      {summary_stats.get('ajax_calls', 0):,}
-  Inline CSS:               {summary_stats.get('inline_css', 0):,}
-  Inline JS:                {summary_stats.get('inline_js', 0):,}
-  Internal Style Blocks:    {summary_stats.get('internal_css', 0):,}
-  Internal Script Blocks:   {summary_stats.get('internal_js', 0):,}
-  External Stylesheets:     {summary_stats.get('external_css', 0):,}
-  External Scripts:         {summary_stats.get('external_js', 0):,}
-{'-' * 66}
+  AJAX Calls Detected:      {ajax_calls:,}
+  Inline CSS:               {inline_css:,}
+  Inline JS:                {inline_js:,}
+  Internal Style Blocks:    {internal_css:,}
+  Internal Script Blocks:   {internal_js:,}
+  External Stylesheets:     {external_css:,}
+  External Scripts:         {external_js:,}
+------------------------------------------------------------------
 
 Output Location:
   {output_file}
 
 Analysis complete. Report ready for review.
 """
+_FOOTER_STATS = ('total_files', 'total_dirs', 'total_size_mb', 'total_lines', 'ajax_calls',
+                 'inline_css', 'inline_js', 'internal_css', 'internal_js', 'external_css', 'external_js')
+
+def print_footer(summary_stats, output_file, header_info=""):
+    """Display completion footer with summary and save full execution log to text file"""
+    
+    stats = dict.fromkeys(_FOOTER_STATS, 0)
+    stats.update(summary_stats)
+    summary_text = _FOOTER_TMPL.format(output_file=output_file, **stats)
     print(summary_text)
     
     # Save to file (Banner + Start Info + Summary)
@@ -84,9 +104,15 @@ def main():
         parser = argparse.ArgumentParser(description="RepoScan - Application Depth Analyser")
         parser.add_argument('path', help="Path to the target directory to scan")
         parser.add_argument('--output', help="Path to output directory", default='output')
+        parser.add_argument('--fast', action='store_true',
+                            help="Write the report with PyExcelerate (faster on large scans, needs pyexcelerate)")
+        parser.add_argument('--style', choices=['auto', 'none'], default='auto',
+                            help="Report styling: 'auto' (header colours, column widths, filters) or 'none' (raw data only)")
         args = parser.parse_args()
         target_path = args.path
         output_path = args.output
+        fast = args.fast
+        style = args.style
     else:
         # Interactive Mode
         print("Enter the full path of the code folder to scan:")
@@ -95,13 +121,16 @@ def main():
         output_path = input("> ").strip()
         if not output_path:
             output_path = 'output'
+        fast = False
+        style = 'auto'
     
     # Clean paths
     target_path = os.path.abspath(target_path)
     output_path = os.path.abspath(output_path)
     
-    if not os.path.exists(target_path):
-        print(f"\nError: Target path '{target_path}' does not exist.")
+    # One stat: also rejects a file given where a folder is expected
+    if not os.path.isdir(target_path):
+        print(f"\nError: Target path '{target_path}' does not exist or is not a directory.")
         if len(sys.argv) <= 1: input("\nPress Enter to exit...")
         sys.exit(1)
     
@@ -123,33 +152,43 @@ Starting scan...
     print(start_info)
     print("=" * 66)
     
-    # Initialize components
+    # Initialize components (imported here: pandas is slow to load, so --help and
+    # argument errors return without it)
+    from src.scanner import Scanner
+    from src.reporter import Reporter, fast_writer_available
+    if fast and not fast_writer_available():
+        print("Warning: --fast needs pyexcelerate (pip install pyexcelerate). Using openpyxl.")
     scanner = Scanner(target_path)
-    reporter = Reporter(output_path)
+    reporter = Reporter(output_path, fast=fast)
     
     # Run scan
     print("\nAnalyzing codebase structure...")
     inventory, dir_stats, ajax_details = scanner.scan(verbose=verbose)
     
-    if not inventory:
+    # inventory holds one list per column
+    total_files = len(inventory['Full_Path'])
+    if not total_files:
         print("\nWarning: No files found to report.")
         if len(sys.argv) <= 1: input("\nPress Enter to exit...")
         return
 
     # Calculate summary stats
-    total_files = len(inventory)
     total_dirs = len(dir_stats)
     ajax_calls = sum(1 for detail in ajax_details if detail.get('Is_Counted') == 'Yes')
-    total_lines = sum(item.get('Line_Count', 0) for item in inventory)
-    total_size_kb = sum(item.get('Size_KB', 0) for item in inventory)
+    
+    # Every per-file total straight from its column
+    totals = {key: sum(inventory[key]) for key in SUMMED_COLUMNS}
+    
+    total_lines = totals['Line_Count']
+    total_size_kb = totals['Size_KB']
     total_size_mb = total_size_kb / 1024
     
-    inline_css = sum(item.get('Inline_CSS_Count', 0) for item in inventory)
-    inline_js = sum(item.get('Inline_JS_Count', 0) for item in inventory)
-    internal_css = sum(item.get('Internal_Style_Blocks_Count', 0) for item in inventory)
-    internal_js = sum(item.get('Internal_Script_Blocks_Count', 0) for item in inventory)
-    external_css = sum(item.get('External_Stylesheet_Links_Count', 0) for item in inventory)
-    external_js = sum(item.get('External_Script_Tags_Count', 0) for item in inventory)
+    inline_css = totals['Inline_CSS_Count']
+    inline_js = totals['Inline_JS_Count']
+    internal_css = totals['Internal_Style_Blocks_Count']
+    internal_js = totals['Internal_Script_Blocks_Count']
+    external_css = totals['External_Stylesheet_Links_Count']
+    external_js = totals['External_Script_Tags_Count']
     
     summary_stats = {
         'total_files': total_files,
@@ -167,7 +206,7 @@ Starting scan...
     
     # Generate Report
     print("\nGenerating Excel report...")
-    report_file = reporter.generate_report(inventory, dir_stats, ajax_details)
+    report_file = reporter.generate_report(inventory, dir_stats, ajax_details, style=style)
     
     elapsed_time = time.time() - start_time
     print(f"  Completed in {elapsed_time:.2f} seconds")
@@ -1,81 +1,216 @@
 import pandas as pd
 import os
-import glob
+import itertools
 from datetime import datetime
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, NamedStyle
 from openpyxl.utils import get_column_letter
 
+try:
+    import pyexcelerate
+    from pyexcelerate.Border import Border as FastBorder
+    from pyexcelerate.Borders import Borders as FastBorders
+except ImportError:
+    pyexcelerate = None
+
+# Report file names: <prefix><timestamp>.xlsx
+REPORT_PREFIX = "Application_Depth_Tracker_"
+
+# Rows sampled per column when sizing widths (performance optimization)
+WIDTH_SAMPLE_ROWS = 100
+
+# Integer inventory columns totalled for the Summary_Dashboard
+SUMMARY_COUNT_COLUMNS = [
+    'Line_Count',
+    'Inline_CSS_Count', 'Internal_Style_Blocks_Count', 'External_Stylesheet_Links_Count',
+    'Inline_JS_Count', 'Internal_Script_Blocks_Count', 'External_Script_Tags_Count',
+    'AJAX_Calls_Count', 'Dynamic_JS_Gen_Count', 'Dynamic_CSS_Gen_Count',
+]
+
+# Low-cardinality inventory columns held as pandas categoricals
+CATEGORY_COLUMNS = ('Directory', 'Extension', 'Has_Ajax_Calls')
+
+# Shared cell styles
+_HEADER_FONT = Font(bold=True, color="FFFFFF")
+_HEADER_FILL = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+_HEADER_ALIGN = Alignment(horizontal="center", vertical="center")
+_THIN_BORDER = Border(left=Side(style='thin'), right=Side(style='thin'), 
+                      top=Side(style='thin'), bottom=Side(style='thin'))
+_TITLE_FONT = Font(bold=True, size=12, color="FFFFFF")
+
+# generate_report style choices: 'auto' styles every sheet, 'none' writes raw data
+REPORT_STYLES = ('auto', 'none')
+
+# Workbook-level named styles for the header row and section titles
+HEADER_STYLE = "RepoScan Header"
+TITLE_STYLE = "RepoScan Section Title"
+
+if pyexcelerate is not None:
+    # The same styles as shared PyExcelerate Style objects (one style entry per workbook)
+    _FAST_FILL = pyexcelerate.Fill(background=pyexcelerate.Color(0x36, 0x60, 0x92))
+    _FAST_HEADER = pyexcelerate.Style(
+        font=pyexcelerate.Font(bold=True, color=pyexcelerate.Color(255, 255, 255)),
+        fill=_FAST_FILL,
+        alignment=pyexcelerate.Alignment(horizontal="center", vertical="center"),
+        borders=FastBorders(left=FastBorder(), right=FastBorder(), top=FastBorder(), bottom=FastBorder()))
+    _FAST_TITLE = pyexcelerate.Style(
+        font=pyexcelerate.Font(bold=True, size=12, color=pyexcelerate.Color(255, 255, 255)),
+        fill=_FAST_FILL)
+
+
+def fast_writer_available():
+    return pyexcelerate is not None
+
 class Reporter:
-    def __init__(self, output_dir):
+    def __init__(self, output_dir, fast=False):
         self.output_dir = output_dir
+        # fast: write with PyExcelerate instead of openpyxl (falls back when not installed)
+        self.fast = fast and fast_writer_available()
         if not os.path.exists(self.output_dir):
             os.makedirs(self.output_dir)
 
     def clean_old_reports(self):
         """Removes existing tracker files to ensure a clean output."""
-        pattern = os.path.join(self.output_dir, "Application_Depth_Tracker_*.xlsx")
-        for f in glob.glob(pattern):
+        # One directory listing with a prefix/suffix check (what the old glob pattern matched)
+        try:
+            with os.scandir(self.output_dir) as it:
+                old_reports = [entry.path for entry in it
+                               if entry.name.startswith(REPORT_PREFIX) and entry.name.endswith(".xlsx")
+                               and entry.is_file()]
+        except OSError:
+            return
+        for f in old_reports:
             try:
                 os.remove(f)
                 print(f"Removed old report: {f}")
             except Exception as e:
                 print(f"Error removing {f}: {e}")
 
-    def _style_worksheet(self, ws):
-        """Applies professional styling to a worksheet."""
-        # Header Style: Bold, Blue Background, White Text
-        header_font = Font(bold=True, color="FFFFFF")
-        header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-        thin_border = Border(left=Side(style='thin'), right=Side(style='thin'), 
-                           top=Side(style='thin'), bottom=Side(style='thin'))
-
-        # Apply to header row
-        for cell in ws[1]:
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = Alignment(horizontal="center", vertical="center")
-            cell.border = thin_border
-
-        # Auto-adjust column widths (optimized for performance)
-        for col in ws.columns:
+    @staticmethod
+    def _column_widths(sample, n_cols):
+        """Column widths sized from the sampled rows (empty cells count as 'None')."""
+        widths = []
+        for col in range(n_cols):
             max_length = 0
-            column = col[0].column_letter
-            column_name = col[0].value
-            
-            # Sample only first 100 rows for width calculation (performance optimization)
-            sample_size = min(100, len(col))
-            for cell in list(col)[:sample_size]:
-                try:
-                    cell_len = len(str(cell.value))
-                    if cell_len > max_length:
-                        max_length = cell_len
-                except:
-                    pass
-            
+            for row in sample:
+                value = row[col] if col < len(row) else None
+                cell_len = len(str(value))
+                if cell_len > max_length:
+                    max_length = cell_len
             adjusted_width = (max_length + 2) * 1.05
             
             # Special handling for Full_Path column - allow wider width
-            if column_name == 'Full_Path':
-                ws.column_dimensions[column].width = min(adjusted_width, 100)
+            column_name = sample[0][col] if sample and col < len(sample[0]) else None
+            limit = 100 if column_name == 'Full_Path' else 50
+            widths.append(min(adjusted_width, limit))
+        return widths
+
+    def _write_sheet(self, wb, title, rows, n_rows, n_cols, title_rows=(), styled=True):
+        """
+        Streams a sheet into the write-only workbook with professional styling.
+        rows yields lists of cell values, header first; n_rows x n_cols is the sheet's
+        extent. title_rows lists 1-based rows whose first cell is a section title.
+        Widths and the AutoFilter must be set before any row is written, so they are
+        computed from the sampled first rows up front. styled=False writes the bare
+        values with no widths, AutoFilter or header styles.
+        """
+        if not styled:
+            if self.fast:
+                wb.new_sheet(title, data=self._fast_rows(rows))
             else:
-                ws.column_dimensions[column].width = min(adjusted_width, 50)
+                ws = wb.create_sheet(title)
+                for row in rows:
+                    ws.append(row)
+            return
+
+        rows = iter(rows)
+        sample = list(itertools.islice(rows, WIDTH_SAMPLE_ROWS))
+        widths = self._column_widths(sample, n_cols)
+        if self.fast:
+            self._write_fast_sheet(wb, title, itertools.chain(sample, rows), n_cols, widths, title_rows)
+            return
+
+        ws = wb.create_sheet(title)
+        for col, width in enumerate(widths, 1):
+            ws.column_dimensions[get_column_letter(col)].width = width
 
         # Add AutoFilter
-        ws.auto_filter.ref = ws.dimensions
+        ws.auto_filter.ref = f"A1:{get_column_letter(n_cols)}{n_rows}"
+
+        for row_num, row in enumerate(itertools.chain(sample, rows), 1):
+            if row_num == 1:
+                # Header Style: Bold, Blue Background, White Text
+                row = [self._styled_cell(ws, value, HEADER_STYLE) for value in row]
+            elif row_num in title_rows:
+                row = [self._styled_cell(ws, row[0], TITLE_STYLE)] + list(row[1:])
+            ws.append(row)
+
+    @staticmethod
+    def _write_fast_sheet(wb, title, rows, n_cols, widths, title_rows):
+        """
+        PyExcelerate variant of _write_sheet: the whole table is handed over as one
+        2D list and styles are applied per range from the shared Style objects.
+        """
+        ws = wb.new_sheet(title, data=Reporter._fast_rows(rows))
+        ws.range((1, 1), (1, n_cols)).style = [[_FAST_HEADER] * n_cols]
+        for row_num in title_rows:
+            ws.set_cell_style(row_num, 1, _FAST_TITLE)
+        for col, width in enumerate(widths, 1):
+            ws.set_col_style(col, pyexcelerate.Style(size=width))
+        # Covers the used range, the same A1:<last col><last row> as the openpyxl path
+        ws.auto_filter = True
+
+    @staticmethod
+    def _fast_rows(rows):
+        """Rows as the 2D list PyExcelerate takes; blank cells stay empty rather than empty strings."""
+        return [[None if value == '' else value for value in row] for row in rows]
 
-    def generate_report(self, inventory, dir_stats, ajax_details=None):
-        """Generates a standardized Excel report."""
+    @staticmethod
+    def _styled_cell(ws, value, style_name):
+        cell = WriteOnlyCell(ws, value=value)
+        cell.style = style_name
+        return cell
+
+    @staticmethod
+    def _add_named_styles(wb):
+        """Registers the header and section title styles once per workbook."""
+        wb.add_named_style(NamedStyle(name=HEADER_STYLE, font=_HEADER_FONT, fill=_HEADER_FILL,
+                                      alignment=_HEADER_ALIGN, border=_THIN_BORDER))
+        wb.add_named_style(NamedStyle(name=TITLE_STYLE, font=_TITLE_FONT, fill=_HEADER_FILL))
+
+    @staticmethod
+    def _frame_rows(df, columns=None, header=None):
+        """
+        Header then data rows of a DataFrame, missing values written as blanks.
+        columns picks a subset straight from df's own columns (no sub-DataFrame copy);
+        header relabels them.
+        """
+        if columns is None:
+            columns = list(df.columns)
+        yield list(header or columns)
+        for row in zip(*(df[column] for column in columns)):
+            yield ['' if value is None or value != value else value for value in row]
+
+    def generate_report(self, inventory, dir_stats, ajax_details=None, style='auto'):
+        """
+        Generates a standardized Excel report.
+        style='auto' styles every sheet (header colours, column widths, AutoFilter);
+        style='none' writes the raw data only.
+        """
+        if style not in REPORT_STYLES:
+            raise ValueError(f"style must be one of {REPORT_STYLES}, got {style!r}")
+        styled = style != 'none'
         self.clean_old_reports()
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_file = os.path.join(self.output_dir, f"Application_Depth_Tracker_{timestamp}.xlsx")
+        output_file = os.path.join(self.output_dir, f"{REPORT_PREFIX}{timestamp}.xlsx")
         
         # --- Prepare Data ---
 
         # 1. Summary Dashboard Data
-        df_inv = pd.DataFrame(inventory)
+        # inventory is column-oriented (one list per column): no per-row dict inference
+        df_inv = pd.DataFrame(inventory, copy=False)
         total_files = len(df_inv)
-        total_lines = df_inv['Line_Count'].sum() if not df_inv.empty else 0
-        total_size_mb = df_inv['Size_KB'].sum() / 1024 if not df_inv.empty else 0
 
         # Extension Breakdown
         if not df_inv.empty:
@@ -84,23 +219,35 @@ class Reporter:
         else:
             ext_counts = pd.DataFrame(columns=['Extension', 'File Count'])
 
-        # Calculate Complexity Metrics Totals
+        # Calculate Totals: one sum over the integer columns (Size_KB is the only
+        # float column and is summed on its own so the counts stay integers)
         if not df_inv.empty:
-            total_inline_css = df_inv['Inline_CSS_Count'].sum()
-            total_internal_style = df_inv['Internal_Style_Blocks_Count'].sum()
-            total_external_css = df_inv['External_Stylesheet_Links_Count'].sum()
-            total_inline_js = df_inv['Inline_JS_Count'].sum()
-            total_internal_script = df_inv['Internal_Script_Blocks_Count'].sum()
-            total_external_js = df_inv['External_Script_Tags_Count'].sum()
-            total_ajax = df_inv['AJAX_Calls_Count'].sum()
-            files_with_ajax = len(df_inv[df_inv['Has_Ajax_Calls'] == 'Yes'])
-            total_dynamic_js = df_inv['Dynamic_JS_Gen_Count'].sum()
-            total_dynamic_css = df_inv['Dynamic_CSS_Gen_Count'].sum()
+            totals = df_inv[SUMMARY_COUNT_COLUMNS].sum()
+            total_lines = totals['Line_Count']
+            total_size_mb = df_inv['Size_KB'].sum() / 1024
+            total_inline_css = totals['Inline_CSS_Count']
+            total_internal_style = totals['Internal_Style_Blocks_Count']
+            total_external_css = totals['External_Stylesheet_Links_Count']
+            total_inline_js = totals['Inline_JS_Count']
+            total_internal_script = totals['Internal_Script_Blocks_Count']
+            total_external_js = totals['External_Script_Tags_Count']
+            total_ajax = totals['AJAX_Calls_Count']
+            files_with_ajax = (df_inv['Has_Ajax_Calls'].values == 'Yes').sum()
+            total_dynamic_js = totals['Dynamic_JS_Gen_Count']
+            total_dynamic_css = totals['Dynamic_CSS_Gen_Count']
         else:
+            total_lines = total_size_mb = 0
             total_inline_css = total_internal_style = total_external_css = 0
             total_inline_js = total_internal_script = total_external_js = 0
             total_ajax = files_with_ajax = total_dynamic_js = total_dynamic_css = 0
 
+        # Few distinct values per row count: store these as categoricals (codes plus one
+        # copy of each label) for the rest of the report. Done after value_counts so
+        # equal extension counts keep their first-seen order.
+        if not df_inv.empty:
+            for column in CATEGORY_COLUMNS:
+                df_inv[column] = df_inv[column].astype('category')
+
         # Create Summary DataFrame with Basic Metrics
         summary_data = {
             'Metric': ['Total Files', 'Total Code Lines', 'Total Size (MB)'],
@@ -152,26 +299,26 @@ class Reporter:
         df_complexity_summary = pd.DataFrame(complexity_summary_data)
 
         # 2. Directory Analysis Data
-        dir_rows = []
-        for dirname, stats in dir_stats.items():
+        # Built column by column from dir_stats rather than one dict per directory
+        stats_list = list(dir_stats.values())
+        df_dir_stats = pd.DataFrame({
+            'Directory': list(dir_stats),
+            'Depth': [stats.get('depth', 0) for stats in stats_list],
+            'File_Count': [stats['count'] for stats in stats_list],
+            'Total_Lines': [stats['lines'] for stats in stats_list],
             # Format extension breakdown string
-            ext_str = ", ".join([f"{k}: {v}" for k, v in stats.get('extensions', {}).items()])
-            
-            dir_rows.append({
-                'Directory': dirname,
-                'Depth': stats.get('depth', 0),
-                'File_Count': stats['count'],
-                'Total_Lines': stats['lines'],
-                'Extensions_Breakdown': ext_str
-            })
-        df_dir_stats = pd.DataFrame(dir_rows)
+            'Extensions_Breakdown': [", ".join([f"{k}: {v}" for k, v in stats.get('extensions', {}).items()])
+                                     for stats in stats_list],
+        })
         # Sort by depth then name
         if not df_dir_stats.empty:
             df_dir_stats = df_dir_stats.sort_values(by=['Depth', 'Directory'])
 
         # 3. File Inventory Data (Basic Metadata Only)
+        # Tabs 3 and 4 are read column by column from df_inv when written, not copied out
         cols_basic = ['Directory', 'Filename', 'Extension', 'Line_Count', 'Size_KB', 'Full_Path']
-        df_details = df_inv[cols_basic] if not df_inv.empty else pd.DataFrame(columns=cols_basic)
+        # Rename Directory to Folder Path for File_Details tab
+        header_basic = ['Folder Path' if col == 'Directory' else col for col in cols_basic]
         
         # 4. Complexity Metrics Data (Dedicated Tab)
         cols_complexity = [
@@ -180,54 +327,45 @@ class Reporter:
             'Inline_JS_Count', 'Internal_Script_Blocks_Count', 'External_Script_Tags_Count', 
             'AJAX_Calls_Count', 'Has_Ajax_Calls', 'Dynamic_JS_Gen_Count', 'Dynamic_CSS_Gen_Count'
         ]
-        df_complexity = df_inv[cols_complexity] if not df_inv.empty else pd.DataFrame(columns=cols_complexity)
+        if df_inv.empty:
+            df_inv = pd.DataFrame(columns=list(dict.fromkeys(cols_basic + cols_complexity)))
 
         # 5. AJAX Detailed Report Data
         df_ajax = pd.DataFrame(ajax_details) if ajax_details else pd.DataFrame(columns=['File_Path', 'Line', 'Code_Snippet', 'Category', 'Capability', 'Difficulty'])
 
-        # Rename Directory to Folder Path for File_Details tab
-        df_details = df_details.rename(columns={'Directory': 'Folder Path'})
-
         # --- Write to Excel ---
+        # Write-only workbook: rows stream to the sheet XML instead of living in memory
         try:
-            with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
-                # Tab 1: Summary_Dashboard
-                # Write Summary Metrics starting from row 0
-                df_summary_main.to_excel(writer, sheet_name='Summary_Dashboard', startrow=0, startcol=0, index=False)
-                
-                # Write Complexity Metrics Summary
-                start_row_complexity = len(df_summary_main) + 3
-                ws = writer.book['Summary_Dashboard']
-                ws.cell(row=start_row_complexity, column=1, value="Complexity Metrics Summary").font = Font(bold=True, size=12, color="FFFFFF")
-                ws.cell(row=start_row_complexity, column=1).fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-                df_complexity_summary.to_excel(writer, sheet_name='Summary_Dashboard', startrow=start_row_complexity, startcol=0, index=False)
-                
-                # Write Extension Breakdown below
-                start_row_ext = start_row_complexity + len(df_complexity_summary) + 3
-                ws.cell(row=start_row_ext, column=1, value="Global Extension Breakdown").font = Font(bold=True, size=12, color="FFFFFF")
-                ws.cell(row=start_row_ext, column=1).fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-                ext_counts.to_excel(writer, sheet_name='Summary_Dashboard', startrow=start_row_ext, startcol=0, index=False)
-                
-                # Tab 2: Directory_Analysis
-                df_dir_stats.to_excel(writer, sheet_name='Directory_Analysis', index=False)
-
-                # Tab 3: File_Details
-                df_details.to_excel(writer, sheet_name='File_Details', index=False)
-                
-                # Tab 4: Complexity_Metrics
-                df_complexity.to_excel(writer, sheet_name='Complexity_Metrics', index=False)
-                
-                # Tab 5: AJAX_Detailed_Report
-                df_ajax.to_excel(writer, sheet_name='AJAX_Detailed_Report', index=False)
-
-                # Apply Styling
-                self._style_worksheet(writer.sheets['Summary_Dashboard'])
-                self._style_worksheet(writer.sheets['Directory_Analysis'])
-                self._style_worksheet(writer.sheets['File_Details'])
-                self._style_worksheet(writer.sheets['Complexity_Metrics'])
-                
-                self._style_worksheet(writer.sheets['AJAX_Detailed_Report'])
+            if self.fast:
+                wb = pyexcelerate.Workbook()
+            else:
+                wb = Workbook(write_only=True)
+                if styled:
+                    self._add_named_styles(wb)
+
+            # Tab 1: Summary_Dashboard
+            # Summary Metrics from row 1, then each titled section below it
+            summary_rows = list(self._frame_rows(df_summary_main))
+            title_rows = []
+            for section_title, df_section in (("Complexity Metrics Summary", df_complexity_summary),
+                                              ("Global Extension Breakdown", ext_counts)):
+                summary_rows.append([])
+                summary_rows.append([section_title])
+                title_rows.append(len(summary_rows))
+                summary_rows.extend(self._frame_rows(df_section))
+            self._write_sheet(wb, 'Summary_Dashboard', summary_rows, len(summary_rows),
+                              max(len(row) for row in summary_rows), title_rows, styled)
+
+            # Tabs 2-5: one table per sheet
+            for sheet_name, df, columns, header in (('Directory_Analysis', df_dir_stats, None, None),
+                                                    ('File_Details', df_inv, cols_basic, header_basic),
+                                                    ('Complexity_Metrics', df_inv, cols_complexity, None),
+                                                    ('AJAX_Detailed_Report', df_ajax, None, None)):
+                n_cols = len(df.columns) if columns is None else len(columns)
+                self._write_sheet(wb, sheet_name, self._frame_rows(df, columns, header), len(df) + 1,
+                                  max(n_cols, 1), styled=styled)
 
+            wb.save(output_file)
             print("Report generated successfully.")
             return output_file
         except Exception as e:
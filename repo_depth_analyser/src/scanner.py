@@ -1,14 +1,51 @@
 import os
+import sys
 import collections
 import re
 import concurrent.futures
 
+# Line counting is mostly waiting on file reads, so use more threads than cores
+SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Bytes read per chunk when counting lines without decoding
+LINE_COUNT_CHUNK = 1 << 20
+
+
+def _count_line_breaks(f):
+    """
+    Counts line breaks in a binary file the way text mode sees them (\n, \r\n or a
+    lone \r each count once). Returns (breaks, last byte of the file).
+    """
+    breaks = 0
+    last = b''
+    while True:
+        chunk = f.read(LINE_COUNT_CHUNK)
+        if not chunk:
+            break
+        breaks += chunk.count(b'\n') + chunk.count(b'\r') - chunk.count(b'\r\n')
+        # A \r\n split across two chunks was counted twice
+        if last == b'\r' and chunk[:1] == b'\n':
+            breaks -= 1
+        last = chunk[-1:]
+    return breaks, last
+
+# File inventory columns, in report order
+INVENTORY_COLUMNS = (
+    'Directory', 'Filename', 'Extension', 'Size_KB', 'Line_Count',
+    'Inline_CSS_Count', 'Internal_Style_Blocks_Count', 'External_Stylesheet_Links_Count',
+    'Inline_JS_Count', 'Internal_Script_Blocks_Count', 'External_Script_Tags_Count',
+    'AJAX_Calls_Count', 'Has_Ajax_Calls', 'Dynamic_JS_Gen_Count', 'Dynamic_CSS_Gen_Count',
+    'Full_Path',
+)
+
 
 class Scanner:
     def __init__(self, target_dir):
         self.target_dir = os.path.abspath(target_dir)
-        self.file_inventory = []
-        self.directory_stats = collections.defaultdict(lambda: {'count': 0, 'lines': 0})
+        # One list per column (see INVENTORY_COLUMNS), so the report builds its DataFrame directly
+        self.file_inventory = {column: [] for column in INVENTORY_COLUMNS}
+        self.directory_stats = collections.defaultdict(
+            lambda: {'count': 0, 'lines': 0, 'extensions': collections.defaultdict(int)})
         
         # Folders to exclude (dependencies, build outputs, version control)
         # Folders to exclude (dependencies, build outputs, version control)
@@ -170,8 +207,8 @@ class Scanner:
             )
         }
 
-    def count_lines_and_analyze(self, filepath):
-        """Counts lines and scans for complexity metrics."""
+    def count_lines_and_analyze(self, filepath, file_size=None):
+        """Counts lines and scans for complexity metrics. file_size (bytes) saves a stat when already known."""
         metrics = {
             'lines': 0,
             'inline_css': 0, 'internal_style_blocks': 0, 'external_stylesheet_links': 0,
@@ -192,10 +229,19 @@ class Scanner:
         
         try:
             # Skip very large files (> 10MB) to prevent memory issues
-            file_size = os.path.getsize(filepath)
+            if file_size is None:
+                file_size = os.path.getsize(filepath)
             if file_size > 10 * 1024 * 1024:  # 10MB limit
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                    metrics['lines'] = sum(1 for _ in f)
+                with open(filepath, 'rb') as f:
+                    breaks, last = _count_line_breaks(f)
+                # An unterminated last line still counts
+                metrics['lines'] = breaks + (1 if last not in (b'', b'\n', b'\r') else 0)
+                return metrics
+
+            # Non-web files only need a line count: count breaks in the raw bytes, no decoding
+            if ext not in web_exts:
+                with open(filepath, 'rb') as f:
+                    metrics['lines'] = _count_line_breaks(f)[0] + 1
                 return metrics
             
             with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
@@ -482,23 +528,25 @@ class Scanner:
             
         return metrics
 
-    def process_file(self, root, file):
-        """Worker function to process a single file."""
-        file_path = os.path.join(root, file)
-        size_kb = os.path.getsize(file_path) / 1024
+    def process_file(self, root, rel_dir, depth, file, file_path, size):
+        """Worker function to process a single file (path and size in bytes from the walk's scandir entry)."""
+        size_kb = size / 1024
         
-        # Get extension
-        _, ext = os.path.splitext(file)
-        if not ext:
-            ext = "(No Extension)"
+        # Get extension (as os.path.splitext: leading dots, as in '.gitignore', are not one)
+        dot = file.rfind('.')
+        if dot > len(file) - len(file.lstrip('.')):
+            # Interned: the few distinct extensions are shared by every inventory row
+            ext = sys.intern(file[dot:].lower())
         else:
-            ext = ext.lower()
+            ext = "(No Extension)"
             
         # Analyze File
-        metrics = self.count_lines_and_analyze(file_path)
+        metrics = self.count_lines_and_analyze(file_path, size)
         
         return {
             'root': root,
+            'rel_dir': rel_dir,
+            'depth': depth,
             'file': file,
             'ext': ext,
             'size_kb': size_kb,
@@ -506,28 +554,55 @@ class Scanner:
             'file_path': file_path
         }
 
+    def _walk(self, path, rel_dir, depth, all_files):
+        """
+        Collects (root, rel_dir, depth, file, file_path, size) for every file under path, in os.walk
+        order: a directory's files first, then its subdirectories. The size comes from
+        the scandir entry's stat, and rel_dir/depth are worked out once per directory.
+        """
+        try:
+            with os.scandir(path) as it:
+                entries = list(it)
+        except OSError:
+            return
+        subdirs = []
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if is_dir:
+                # Like os.walk: symlinked folders are not followed
+                if entry.name not in self.excluded_folders and not entry.is_symlink():
+                    subdirs.append(entry)
+                continue
+            try:
+                size = entry.stat().st_size
+            except OSError:
+                continue
+            all_files.append((path, rel_dir, depth, entry.name, entry.path, size))
+        for entry in subdirs:
+            child_rel = entry.name if depth == 0 else os.path.join(rel_dir, entry.name)
+            self._walk(entry.path, child_rel, depth + 1, all_files)
+
     def scan(self, verbose=False):
         """Walks the directory and collects metadata."""
-        # Collect all files to scan
+        # Collect all files to scan (excluded folders are pruned during the walk)
         all_files = []
-        for root, dirs, files in os.walk(self.target_dir):
-            # Filter out excluded directories (modifies dirs in-place)
-            dirs[:] = [d for d in dirs if d not in self.excluded_folders]
-            
-            for file in files:
-                all_files.append((root, file))
+        self._walk(self.target_dir, '(Root)', 0, all_files)
         
         if verbose:
-            print(f"\nFound {len(all_files):,} files in {len(set(r for r, f in all_files)):,} directories")
+            print(f"\nFound {len(all_files):,} files in {len(set(f[0] for f in all_files)):,} directories")
             print("\nScanning folders:")
             print("-" * 66)
                 
         # Use ThreadPoolExecutor for concurrent scanning
         results = []
         processed_dirs = set()
-        with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-            future_to_file = {executor.submit(self.process_file, r, f): (r, f) for r, f in all_files}
-            for future in concurrent.futures.as_completed(future_to_file):
+        # Results are taken in submission (walk) order so the report rows are deterministic
+        with concurrent.futures.ThreadPoolExecutor(max_workers=SCAN_WORKERS) as executor:
+            futures = [executor.submit(self.process_file, *f) for f in all_files]
+            for future in futures:
                 try:
                     data = future.result()
                     results.append(data)
@@ -535,9 +610,7 @@ class Scanner:
                     # Verbose progress per folder
                     if verbose and data['root'] not in processed_dirs:
                         processed_dirs.add(data['root'])
-                        rel_dir = os.path.relpath(data['root'], self.target_dir)
-                        if rel_dir == '.':
-                            rel_dir = '(Root)'
+                        rel_dir = data['rel_dir']
                         
                         # Count elements in this directory
                         dir_results = [r for r in results if r['root'] == data['root']]
@@ -555,35 +628,33 @@ class Scanner:
         # Aggregate Results
         all_ajax_details = []
         
+        inventory = self.file_inventory
         for item in results:
-            root = item['root']
-            rel_dir = os.path.relpath(root, self.target_dir)
-            if rel_dir == '.': rel_dir = '(Root)'
-            depth = 0 if rel_dir == '(Root)' else rel_dir.count(os.sep) + 1
+            rel_dir = item['rel_dir']
+            depth = item['depth']
+            metrics = item['metrics']
             
             # Update Inventory
-            self.file_inventory.append({
-                'Directory': rel_dir,
-                'Filename': item['file'],
-                'Extension': item['ext'],
-                'Size_KB': round(item['size_kb'], 2),
-                'Line_Count': item['metrics']['lines'],
-                'Inline_CSS_Count': item['metrics']['inline_css'],
-                'Internal_Style_Blocks_Count': item['metrics']['internal_style_blocks'],
-                'External_Stylesheet_Links_Count': item['metrics']['external_stylesheet_links'],
-                'Inline_JS_Count': item['metrics']['inline_js'],
-                'Internal_Script_Blocks_Count': item['metrics']['internal_script_blocks'],
-                'External_Script_Tags_Count': item['metrics']['external_script_tags'],
-                'AJAX_Calls_Count': item['metrics']['ajax_calls'],
-                'Has_Ajax_Calls': item['metrics']['has_ajax_calls'],
-                'Dynamic_JS_Gen_Count': item['metrics']['dynamic_js'],
-                'Dynamic_CSS_Gen_Count': item['metrics']['dynamic_css'],
-                'Full_Path': item['file_path']
-            })
+            inventory['Directory'].append(rel_dir)
+            inventory['Filename'].append(item['file'])
+            inventory['Extension'].append(item['ext'])
+            inventory['Size_KB'].append(round(item['size_kb'], 2))
+            inventory['Line_Count'].append(metrics['lines'])
+            inventory['Inline_CSS_Count'].append(metrics['inline_css'])
+            inventory['Internal_Style_Blocks_Count'].append(metrics['internal_style_blocks'])
+            inventory['External_Stylesheet_Links_Count'].append(metrics['external_stylesheet_links'])
+            inventory['Inline_JS_Count'].append(metrics['inline_js'])
+            inventory['Internal_Script_Blocks_Count'].append(metrics['internal_script_blocks'])
+            inventory['External_Script_Tags_Count'].append(metrics['external_script_tags'])
+            inventory['AJAX_Calls_Count'].append(metrics['ajax_calls'])
+            inventory['Has_Ajax_Calls'].append(metrics['has_ajax_calls'])
+            inventory['Dynamic_JS_Gen_Count'].append(metrics['dynamic_js'])
+            inventory['Dynamic_CSS_Gen_Count'].append(metrics['dynamic_css'])
+            inventory['Full_Path'].append(item['file_path'])
             
             # Collect AJAX Details
-            if item['metrics']['ajax_details']:
-                for detail in item['metrics']['ajax_details']:
+            if metrics['ajax_details']:
+                for detail in metrics['ajax_details']:
                     detail['File_Path'] = item['file_path']
                     detail['Filename'] = item['file']
                     all_ajax_details.append(detail)
@@ -591,10 +662,8 @@ class Scanner:
             # Update Directory Stats
             stats = self.directory_stats[rel_dir]
             stats['count'] += 1
-            stats['lines'] += item['metrics']['lines']
+            stats['lines'] += metrics['lines']
             stats['depth'] = depth
-            if 'extensions' not in stats:
-                stats['extensions'] = collections.defaultdict(int)
             stats['extensions'][item['ext']] += 1
 
         if verbose:
@@ -97,20 +97,27 @@ AJAX_CALL_PATTERN = re.compile(
     re.IGNORECASE
 )
 
-# Server-side dependency patterns
-SERVER_PATTERNS = [
-    re.compile(r'@Model\.', re.IGNORECASE),
-    re.compile(r'@ViewBag\.', re.IGNORECASE),
-    re.compile(r'@ViewData\.', re.IGNORECASE),
-    re.compile(r'@Url\.Action', re.IGNORECASE),
-    re.compile(r'@Url\.Content', re.IGNORECASE),
-    re.compile(r'<%=', re.IGNORECASE),
-    re.compile(r'<%:', re.IGNORECASE),
-    re.compile(r'<%\s', re.IGNORECASE),
-    re.compile(r'\{\{.*?\}\}', re.IGNORECASE),  # Template engines
-    re.compile(r'\bResponse\.Write\b', re.IGNORECASE),
-    re.compile(r'\bRequest\.Form\b', re.IGNORECASE),
-]
+# Server-side dependency patterns. Plain literals (lowercase, matched against the
+# lowercased code) are checked with `in`; only patterns needing regex features use re.
+SERVER_LITERALS = (
+    '@model.',
+    '@viewbag.',
+    '@viewdata.',
+    '@url.action',
+    '@url.content',
+    '<%=',
+    '<%:',
+)
+SERVER_PATTERN = re.compile(
+    r'<%\s|'           # Classic ASP / WebForms block
+    r'\{\{.*?\}\}|'    # Template engines
+    r'\bResponse\.Write\b|'
+    r'\bRequest\.Form\b',
+    re.IGNORECASE
+)
+# Literal (lowercase) that each SERVER_PATTERN alternative contains; without one the
+# regex cannot match, so the search is skipped
+SERVER_PATTERN_HINTS = ('<%', '{{', 'response.write', 'request.form')
 
 # URL extraction patterns
 URL_PATTERNS = {
@@ -387,11 +394,10 @@ def detect_ajax_patterns(snippet) -> bool:
     snippet.is_inline_ajax = is_inline_ajax(snippet.file_path)
     
     # Check for server dependencies
-    snippet.has_server_deps = False
-    for dep_pattern in SERVER_PATTERNS:
-        if dep_pattern.search(code):
-            snippet.has_server_deps = True
-            break
+    lowered = code.lower()
+    snippet.has_server_deps = (any(lit in lowered for lit in SERVER_LITERALS)
+                               or (any(hint in lowered for hint in SERVER_PATTERN_HINTS)
+                                   and SERVER_PATTERN.search(code) is not None))
             
     return True
 
@@ -9,11 +9,15 @@ class ScannerConfig:
         self.root_folder: str = "."
         self.output_folder: str = "."
         self.include_extensions: Set[str] = set()
+        self.exclude_folders: Set[str] = set()
+        self.exclude_files: Set[str] = set()
         self.max_file_size_mb: int = 10
         self.snippet_max_length: int = 500
         # Phase 2 Args
         self.target_url: str = None
         self.mode: str = "static" # static, dynamic, combined, extract
+        # Stream report workbooks to disk (xlsxwriter constant_memory) for very large scans
+        self.streaming: bool = False
 
     @classmethod
     def load(cls, config_path: str = "config.ini") -> 'ScannerConfig':
@@ -46,16 +50,19 @@ class ScannerConfig:
             config.max_file_size_mb = int(parser['Limits'].get('max_file_size_mb', 10))
             config.snippet_max_length = int(parser['Limits'].get('snippet_max_length', 500))
 
+        # Output
+        if 'Output' in parser:
+            config.streaming = parser['Output'].getboolean('streaming', fallback=False)
+
         return config
 
     def validate(self):
         if not os.path.exists(self.root_folder):
             raise ValueError(f"Root folder does not exist: {self.root_folder} (Absolute: {os.path.abspath(self.root_folder)})")
-        if not os.path.exists(self.output_folder):
-            try:
-                os.makedirs(self.output_folder)
-            except OSError as e:
-                raise ValueError(f"Could not create output folder: {self.output_folder}. Error: {e}")
+        try:
+            os.makedirs(self.output_folder, exist_ok=True)
+        except OSError as e:
+            raise ValueError(f"Could not create output folder: {self.output_folder}. Error: {e}")
 
 def parse_arguments() -> ScannerConfig:
     parser = argparse.ArgumentParser(description="RepoScan-Analyser: Static & Dynamic Assessment Utility")
@@ -63,6 +70,7 @@ def parse_arguments() -> ScannerConfig:
     parser.add_argument("--root", help="Root folder to scan (overrides config)")
     parser.add_argument("--output", help="Output folder (overrides config)")
     parser.add_argument("--url", help="Target URL for Dynamic/Combined scan")
+    parser.add_argument("--streaming", action="store_true", help="Stream report workbooks to disk (low memory, needs xlsxwriter)")
     
     # Action Flags
     group = parser.add_mutually_exclusive_group()
@@ -91,6 +99,8 @@ def parse_arguments() -> ScannerConfig:
         config.output_folder = args.output
     if args.url:
         config.target_url = args.url
+    if args.streaming:
+        config.streaming = True
         
     config.validate()
     return config
@@ -3,8 +3,7 @@ import os
 from datetime import datetime
 
 def setup_logger(log_dir: str = "logs"):
-    if not os.path.exists(log_dir):
-        os.makedirs(log_dir)
+    os.makedirs(log_dir, exist_ok=True)
 
     timestamp = datetime.now().strftime("%Y%m%d")
     log_file = os.path.join(log_dir, f"scanner_error_{timestamp}.log")
@@ -4,6 +4,37 @@ from typing import List, Dict, Any
 from bs4 import BeautifulSoup
 import bs4
 
+# Bit flags for the discriminators the Reporter filters on (see CodeSnippet.update_flags)
+CAT_JS = 1 << 0
+CAT_CSS = 1 << 1
+CAT_INTERNAL = 1 << 2
+CAT_EXTERNAL = 1 << 3
+SRC_INLINE = 1 << 4
+SRC_LOCAL = 1 << 5
+SRC_REMOTE = 1 << 6
+CT_SCRIPTBLOCK = 1 << 7
+CT_STYLEBLOCK = 1 << 8
+HAS_AJAX = 1 << 9
+HAS_SERVERDEPS = 1 << 10
+IS_INLINE_AJAX = 1 << 11
+CT_SCRIPTLIKE = 1 << 12  # code_type mentions 'script' (case-insensitive)
+CT_STYLELIKE = 1 << 13   # code_type mentions 'style' or 'css' (case-insensitive)
+
+_CATEGORY_FLAGS = {'JS': CAT_JS, 'CSS': CAT_CSS, 'Internal': CAT_INTERNAL, 'External': CAT_EXTERNAL}
+_SOURCE_FLAGS = {'INLINE': SRC_INLINE, 'LOCAL': SRC_LOCAL, 'REMOTE': SRC_REMOTE}
+_CODE_TYPE_FLAGS = {'scriptblock': CT_SCRIPTBLOCK, 'styleblock': CT_STYLEBLOCK}
+
+# Per-snippet heuristics, compiled once at import
+_JS_PROTO_RE = re.compile(r'href=["\']\s*javascript:', re.IGNORECASE)
+# Complexity patterns run on lowercased code
+_LOGIC_RE = re.compile(r'\bfunction\s+\w+|\bif\s*\(|\bfor\s*\(|\bwhile\s*\(')
+_LISTENER_RE = re.compile(r'\.addeventlistener')
+_DOM_SELECTOR_RE = re.compile(r'document\.getelementbyid|document\.queryselector|\$\(["\']')
+# Server dependency severity tiers
+_SEVERITY_HIGH_RE = re.compile(r'@Model\.|<%\s', re.IGNORECASE)
+_SEVERITY_MEDIUM_RE = re.compile(r'@Url\.|@ViewBag\.|@ViewData\.', re.IGNORECASE)
+_SEVERITY_LOW_RE = re.compile(r'<%=|@DateTime\.', re.IGNORECASE)
+
 class CodeSnippet:
     def __init__(self, file_path: str, start_line: int, end_line: int, category: str, snippet: str, code_type: str, full_code: str = "", ajax_detected: bool = False, source_type: str = "INLINE"):
         self.file_path = file_path
@@ -36,6 +67,26 @@ class CodeSnippet:
         self.server_severity = "None" # Low, Medium, High, None
         self.target_filename_suggestion = "" # {OriginalFilePath}_{BlockType}_L{StartLine}-L{EndLine}.{Extension}
         self.recommended_action = "Review"
+        self.flags = 0
+        self.update_flags()
+
+    def update_flags(self):
+        """Recomputes the integer discriminator bits. Call again after enrichment changes the AJAX fields."""
+        flags = (_CATEGORY_FLAGS.get(self.category, 0)
+                 | _SOURCE_FLAGS.get(self.source_type, 0)
+                 | _CODE_TYPE_FLAGS.get(self.code_type, 0))
+        code_type = self.code_type.lower()
+        if 'script' in code_type:
+            flags |= CT_SCRIPTLIKE
+        if 'style' in code_type or 'css' in code_type:
+            flags |= CT_STYLELIKE
+        if self.ajax_detected:
+            flags |= HAS_AJAX
+        if self.has_server_deps:
+            flags |= HAS_SERVERDEPS
+        if self.is_inline_ajax:
+            flags |= IS_INLINE_AJAX
+        self.flags = flags
 
 
 class Parser:
@@ -120,6 +171,7 @@ class Parser:
             self._calculate_complexity(finding)
             self._assess_severity(finding)
             self._infer_functionality(finding)
+            finding.update_flags()
                 
         return unique_findings
 
@@ -128,11 +180,9 @@ class Parser:
         lines = content.splitlines()
         
         # Regex for 'javascript:' protocol
-        js_proto_pattern = re.compile(r'href=["\']\s*javascript:', re.IGNORECASE)
-        
         for i, line in enumerate(lines):
             line_num = i + 1
-            if js_proto_pattern.search(line):
+            if _JS_PROTO_RE.search(line):
                 findings.append(CodeSnippet(file_path, line_num, line_num, 'JS', line.strip(), 'jsuri', full_code=line.strip(), source_type='INLINE'))
         return findings
 
@@ -296,14 +346,14 @@ class Parser:
         code = snippet.full_code.lower()
         
         # +2 Points: Logic Structures
-        score += 2 * len(re.findall(r'\bfunction\s+\w+|\bif\s*\(|\bfor\s*\(|\bwhile\s*\(', code))
+        score += 2 * len(_LOGIC_RE.findall(code))
         
         # +1 Point: AJAX / Interactive
         if snippet.ajax_detected: score += 1
-        score += 1 * len(re.findall(r'\.addeventlistener', code))
+        score += 1 * len(_LISTENER_RE.findall(code))
         
         # -2 Points: Basic DOM Glue
-        dom_selectors = len(re.findall(r'document\.getelementbyid|document\.queryselector|\$\(["\']', code))
+        dom_selectors = len(_DOM_SELECTOR_RE.findall(code))
         if dom_selectors > 0 and score < 2:
             score -= 2
             
@@ -319,15 +369,15 @@ class Parser:
         severity = "None"
         
         # High: Logic-breaking dependencies (Model properties, Classic ASP blocks)
-        if re.search(r'@Model\.|<%\s', code, re.IGNORECASE):
+        if _SEVERITY_HIGH_RE.search(code):
             severity = "High"
         
         # Medium: Config/Routing (Url.Action, ViewBag)
-        elif re.search(r'@Url\.|@ViewBag\.|@ViewData\.', code, re.IGNORECASE):
+        elif _SEVERITY_MEDIUM_RE.search(code):
             if severity != "High": severity = "Medium"
             
         # Low: Cosmetic/Replaceable (DateTime, simple vars)
-        elif re.search(r'<%=|@DateTime\.', code, re.IGNORECASE):
+        elif _SEVERITY_LOW_RE.search(code):
             if severity == "None": severity = "Low"
             
         snippet.server_severity = severity
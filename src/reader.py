@@ -11,8 +11,9 @@ class FileReader:
         """
         try:
             # First, try reading as binary to detect encoding
-            with open(file_path, 'rb') as f:
-                raw_data = f.read()
+            # Unbuffered: a whole-file read gains nothing from BufferedReader's copy
+            with open(file_path, 'rb', buffering=0) as f:
+                raw_data = f.readall()
             
             result = chardet.detect(raw_data)
             encoding = result['encoding']
@@ -1,52 +1,104 @@
 import openpyxl
+import csv
+import json
+import zipfile
+import itertools
+import operator
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+from openpyxl.utils import get_column_letter
+from openpyxl.worksheet.table import Table, TableStyleInfo
 from typing import List
 import os
 import logging
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
-from .parser import CodeSnippet
+from .parser import (CodeSnippet, CAT_JS, CAT_CSS, CAT_INTERNAL, CAT_EXTERNAL, SRC_INLINE, SRC_LOCAL,
+                     SRC_REMOTE, CT_SCRIPTBLOCK, CT_STYLEBLOCK, CT_SCRIPTLIKE, CT_STYLELIKE, HAS_AJAX,
+                     HAS_SERVERDEPS, IS_INLINE_AJAX)
 from .config import ScannerConfig
+from .xlsx_stream import StreamingWorkbook, StreamingWorksheet, streaming_available
+
+# Block metadata sidecar at the root of extracted_code.zip (one JSON object per line)
+MANIFEST_NAME = "manifest.jsonl"
+
+# Archive folders, laid out as refactoring_utility/check.py reads an unzipped extracted_code/
+BUNDLE_DIRS = ("js/internal", "js/inline", "css/internal", "css/inline")
+
+# Shared cell styles (8-char ARGB colours)
+_HEADER_FONT = Font(bold=True, color="FFFFFFFF")
+_HEADER_FILL = PatternFill("solid", fgColor="FF4F81BD")
+_HEADER_ALIGN = Alignment(horizontal="left", vertical="center", wrap_text=True)
+_LEGEND_HEADER_FILL = PatternFill("solid", fgColor="FF000000")
+_THIN_BORDER = Border(left=Side(style='thin'), right=Side(style='thin'), top=Side(style='thin'), bottom=Side(style='thin'))
+_BOTTOM_BORDER = Border(bottom=Side(style='thin'))
+_BOLD_FONT = Font(bold=True)
+_TITLE_FONT = Font(bold=True, size=16, color="FF2F75B5")
+_SECTION_FONT = Font(bold=True, size=14)
+_LEFT_ALIGN = Alignment(horizontal="left")
+_TOP_ALIGN = Alignment(vertical="top", wrap_text=False)
+_TOP_WRAP_ALIGN = Alignment(vertical="top", wrap_text=True)
+_RED_FILL = PatternFill("solid", fgColor="FFFFC7CE")
+_RED_FONT = Font(color="FF9C0006")
+_YELLOW_FILL = PatternFill("solid", fgColor="FFFFEB9C")
+_YELLOW_FONT = Font(color="FF9C6500")
+_GREEN_FILL = PatternFill("solid", fgColor="FFC6EFCE")
+_GREEN_FONT = Font(color="FF006100")
+
+# Refactoring traffic light: key = (severity << 2) | (complexity << 1) | functionality
+_SEVERITY_BITS = {"High": 2, "Medium": 1}
+_COMPLEXITY_BITS = {"High": 1}
+_FUNCTIONALITY_BITS = {"Page Glue": 1}
+
+def _status_for(severity: int, complexity: int, functionality: int) -> tuple:
+    """(status, recommended method, (fill, font) or None) in decision-tree precedence order."""
+    if severity == 2:
+        return ("🔴 Skipped (Blocked)", "Remove Server Dependencies First", (_RED_FILL, _RED_FONT))
+    if severity == 1:
+        return ("🟡 Skipped (Rewrite)", "Refactor Server Config (API)", (_YELLOW_FILL, _YELLOW_FONT))
+    if complexity:
+        return ("🟡 Manual Review", "Convert to Component (Complex Logic)", (_YELLOW_FILL, _YELLOW_FONT))
+    if functionality:
+        return ("🟢 Leave Inline", "None (Low Value)", None)
+    return ("🟢 Ready", "Move to separate file", (_GREEN_FILL, _GREEN_FONT))
+
+_STATUS_TABLE = tuple(_status_for(key >> 2, (key >> 1) & 1, key & 1) for key in range(12))
+
+# Page types listed in the Crawler Input tracker
+HTML_EXTS = ('.html', '.htm', '.aspx', '.cshtml', '.php', '.jsp')
+
+# Flag masks for the sheet filters (CodeSnippet.flags)
+INLINE_JS = CAT_JS | SRC_INLINE
+INLINE_CSS = CAT_CSS | SRC_INLINE
+LOCAL_JS = CAT_JS | SRC_LOCAL
+LOCAL_CSS = CAT_CSS | SRC_LOCAL
+SRC_LINKED = SRC_LOCAL | SRC_REMOTE
+CAT_REFERENCE = CAT_INTERNAL | CAT_EXTERNAL
 
 class Reporter:
     def __init__(self, config: ScannerConfig, findings: List[CodeSnippet]):
         self.config = config
         self.findings = findings
-        self.wb = openpyxl.Workbook()
+        self.wb = None  # set by each tracker builder
 
     def bundle_code(self):
-        """Extracts inline code to separate files with granular organization."""
-        base_dir = os.path.join(self.config.output_folder, "extracted_code")
-        
-        # Granular Folders
-        folders = {
-            "inline_js": os.path.join(base_dir, "inline_js"),
-            "internal_js": os.path.join(base_dir, "internal_js"),
-            "inline_css": os.path.join(base_dir, "inline_css"),
-            "internal_css": os.path.join(base_dir, "internal_css")
-        }
-        
-        for d in folders.values():
-            if not os.path.exists(d):
-                os.makedirs(d)
-                
+        """Extracts inline code into a single extracted_code.zip, one granular folder per block type."""
+        zip_path = os.path.join(self.config.output_folder, "extracted_code.zip")
+        
+        # Arc names collide when two blocks share file/type/line; last one wins, as with plain files
+        entries = {}
+        manifest = {}
         for f in self.findings:
             if not f.full_code:
                 continue
                 
             # Determine target folder and extension
-            target_folder = ""
-            ext = ""
-            
-            if f.category == 'JS':
-                ext = ".js"
-                if f.source_type == 'LOCAL': target_folder = folders["internal_js"]
-                else: target_folder = folders["inline_js"] # Inline & Remote-but-inline-context
-            elif f.category == 'CSS':
-                ext = ".css"
-                if f.source_type == 'LOCAL': target_folder = folders["internal_css"]
-                else: target_folder = folders["inline_css"]
-            else:
-                continue 
+            subdir = self._bundle_subdir(f)
+            if not subdir:
+                continue
+            ext = ".js" if f.category == 'JS' else ".css"
 
             # Filename Convention: Full Path Structure to avoid collisions
             # Format: {Path_Structure}_{Type}_L{Line}.ext
@@ -57,35 +109,80 @@ class Reporter:
             safe_path = rel_path.replace(":", "").replace(os.sep, "_").replace("/", "_").replace("\\", "_").replace(".", "_")
             
             safe_type = "".join([c if c.isalnum() else "_" for c in f.code_type])
-            filename = f"{safe_path}_{safe_type}_L{f.start_line}{ext}"
-            
-            # Write file
-            try:
-                full_path = os.path.join(target_folder, filename)
-                with open(full_path, "w", encoding="utf-8") as out:
-                    out.write(f.full_code)
-                f.bundled_file = filename
-            except Exception as e:
-                logging.error(f"Failed to bundle code for {f.file_path}: {e}")
+            arcname = f"{subdir}/{safe_path}_{safe_type}_L{f.start_line}{ext}"
+            entries[arcname] = f.full_code
+            manifest[arcname] = {
+                'extracted_file': arcname,
+                'source_path': rel_path.replace(os.sep, "/"),
+                'code_type': f.code_type,
+                'start_line': f.start_line,
+                'end_line': f.end_line,
+                'ext': ext[1:],
+            }
+            f.bundled_file = arcname
+        
+        # One sequential archive write instead of a file per block
+        try:
+            with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=3, allowZip64=True) as zf:
+                # Every folder is present, even when empty, so check.py accepts the unzipped tree
+                for subdir in BUNDLE_DIRS:
+                    zf.writestr(subdir + "/", "")
+                for arcname, code in entries.items():
+                    zf.writestr(arcname, code)
+                # Block metadata as JSON lines, so consumers need not parse it back out of names
+                zf.writestr(MANIFEST_NAME, "".join(json.dumps(row) + "\n" for row in manifest.values()))
+        except Exception as e:
+            logging.error(f"Failed to bundle code into {zip_path}: {e}")
+            for f in self.findings:
+                f.bundled_file = ""
+
+    @staticmethod
+    def _bundle_subdir(f: CodeSnippet) -> str:
+        """Maps a finding to its extracted_code sub-folder ('' if it is not bundled)."""
+        if f.flags & CAT_JS:
+            # Inline & Remote-but-inline-context go to js/inline
+            return "js/internal" if f.flags & SRC_LOCAL else "js/inline"
+        if f.flags & CAT_CSS:
+            return "css/internal" if f.flags & SRC_LOCAL else "css/inline"
+        return ""
+
+    def _extracted_link(self, f: CodeSnippet) -> str:
+        """HYPERLINK formula to the block's file in extracted_code/ (extracted_code.zip unzipped next to the workbook)."""
+        if not f.bundled_file:
+            return ""
+        return f'=HYPERLINK("extracted_code/{f.bundled_file}","open")'
 
     def generate_report(self):
-        # Bundle code first
+        # Bundle code first (stays serial; the workbooks link to the extracted archive)
         self.bundle_code()
         
         # 1. Code Inventory Tracker (Now includes AJAX)
-        self._create_inventory_tracker()
-        
         # 2. Refactoring & Extraction Tracker (Split Tabs)
-        self._create_refactoring_tracker()
-        
         # 3. Crawler Input Tracker
-        self._create_crawler_tracker()
+        # The workbooks share nothing but the findings, so each is built in its own process.
+        builders = ("_create_inventory_tracker", "_create_refactoring_tracker", "_create_crawler_tracker")
+        try:
+            with ProcessPoolExecutor(max_workers=len(builders)) as pool:
+                futures = [pool.submit(_build_tracker, self.config, self.findings, b) for b in builders]
+                for future in futures:
+                    future.result()
+        except (BrokenProcessPool, pickle.PicklingError, OSError) as e:
+            logging.warning(f"Parallel report generation unavailable ({e}). Building workbooks serially.")
+            for builder in builders:
+                getattr(self, builder)()
+
+    def _new_workbook(self, filename: str):
+        """Empty workbook for a tracker: openpyxl by default, a constant-memory stream when config.streaming is set."""
+        if self.config.streaming:
+            if streaming_available():
+                return StreamingWorkbook(os.path.join(self.config.output_folder, filename))
+            logging.warning("Streaming output requested but xlsxwriter is not installed. Using openpyxl.")
+        wb = openpyxl.Workbook()
+        wb.remove(wb.active)
+        return wb
 
     def _create_inventory_tracker(self):
-        wb = openpyxl.Workbook()
-        ws = wb.active
-        wb.remove(ws)
-        
+        wb = self._new_workbook("Code_Inventory.xlsx")
         self.wb = wb 
         self._create_summary_sheet()
         
@@ -107,48 +204,58 @@ class Reporter:
     # Removed _create_ajax_tracker as it is merged
 
     def _create_refactoring_tracker(self):
-        wb = openpyxl.Workbook()
+        wb = self._new_workbook("Refactoring_Tracker.xlsx")
         self.wb = wb
-        wb.remove(wb.active)
         # Split into JS and CSS
         self._create_refactoring_sheet("JS")
         self._create_refactoring_sheet("CSS")
         self._save_wb(wb, "Refactoring_Tracker.xlsx")
 
     def _create_crawler_tracker(self):
-        wb = openpyxl.Workbook()
+        # Append-only sheet: write-only mode streams rows instead of keeping a cell grid
+        wb = openpyxl.Workbook(write_only=True)
         ws = wb.create_sheet("Crawler Input")
-        wb.remove(wb.active if "Sheet" in wb.sheetnames else wb.worksheets[0])
         
         headers = ["Target URL", "Source File", "Rationale", "Interaction Hints"]
         data = []
         
-        # Filter for HTML/ASPX files
-        seen_files = set()
-        for f in self.findings:
-            if f.file_path in seen_files: continue
+        # Filter for HTML/ASPX files: one row per page, findings grouped by path
+        findings_sorted = sorted(self.findings, key=operator.attrgetter('file_path'))
+        for path, group in itertools.groupby(findings_sorted, key=operator.attrgetter('file_path')):
+            if not path.lower().endswith(HTML_EXTS):
+                continue
             
-            ext = os.path.splitext(f.file_path)[1].lower()
-            if ext in ['.html', '.htm', '.aspx', '.cshtml', '.php', '.jsp']:
-                # Transform path to localhost URL (Assumption/Placeholder)
-                rel_path = self._get_relative_path(f.file_path).replace("\\", "/")
-                target = f"http://localhost/{rel_path}"
-                
-                rationale = "Page Entry Point"
-                hints = "Check CSP"
-                if any(x.ajax_detected for x in self.findings if x.file_path == f.file_path):
-                    rationale += ", Contains AJAX"
-                
-                data.append([target, f.file_path, rationale, hints])
-                seen_files.add(f.file_path)
-                
-        # Basic Write (inline here for simplicity as it's new)
-        for col, h in enumerate(headers, 1):
-            ws.cell(row=1, column=col, value=h).font = Font(bold=True)
+            # Transform path to localhost URL (Assumption/Placeholder)
+            rel_path = self._get_relative_path(path).replace("\\", "/")
+            target = f"http://localhost/{rel_path}"
             
-        for row, row_data in enumerate(data, 2):
-            for col, val in enumerate(row_data, 1):
-                ws.cell(row=row, column=col, value=val)
+            rationale = "Page Entry Point"
+            hints = "Check CSP"
+            if any(x.flags & HAS_AJAX for x in group):
+                rationale += ", Contains AJAX"
+            
+            data.append([target, path, rationale, hints])
+                
+        # Plain rows only: append directly, bold header is the sole styling
+        header_cells = []
+        for h in headers:
+            cell = WriteOnlyCell(ws, value=h)
+            cell.font = _BOLD_FONT
+            header_cells.append(cell)
+        ws.append(header_cells)
+        for row_data in data:
+            ws.append(row_data)
+        
+        # CSV copy for crawler tooling that only needs the seed list
+        csv_path = os.path.join(self.config.output_folder, "Crawler_Input.csv")
+        try:
+            with open(csv_path, "w", newline="", encoding="utf-8", buffering=1 << 20) as fh:
+                writer = csv.writer(fh)
+                writer.writerow(headers)
+                writer.writerows(data)
+            logging.info(f"Report saved to: {csv_path}")
+        except PermissionError:
+            logging.error(f"Could not save report to {csv_path}. File might be open.")
                 
         self._save_wb(wb, "Crawler_Input.xlsx")
 
@@ -166,13 +273,35 @@ class Reporter:
         except ValueError:
             return absolute_path
 
+    def _bucketize(self) -> dict:
+        """Counts the Summary inventory buckets in one pass over the findings."""
+        counts = dict.fromkeys(("inline_js_attr", "internal_js_blocks", "external_js_combined",
+                                "inline_css_attr", "internal_css_blocks", "external_css_combined"), 0)
+        for f in self.findings:
+            flags = f.flags
+            # 1. Inline JS (Attributes: onclick, javascript:) / 2. Internal JS (Script Blocks)
+            if (flags & INLINE_JS) == INLINE_JS:
+                counts["internal_js_blocks" if flags & CT_SCRIPTBLOCK else "inline_js_attr"] += 1
+            # Inline CSS (style="") / Internal CSS (<style> blocks)
+            elif (flags & INLINE_CSS) == INLINE_CSS:
+                counts["internal_css_blocks" if flags & CT_STYLEBLOCK else "inline_css_attr"] += 1
+            
+            if flags & SRC_LINKED:
+                # 3. External JS: local (category='Internal') and remote (category='External') src references
+                if flags & (CT_SCRIPTLIKE | CAT_JS | CAT_REFERENCE) and not flags & CT_STYLELIKE:
+                    counts["external_js_combined"] += 1
+                # External CSS (Local <link> + Remote <link>)
+                if flags & (CT_STYLELIKE | CAT_CSS):
+                    counts["external_css_combined"] += 1
+        return counts
+
     def _create_summary_sheet(self):
         ws = self.wb.create_sheet("Summary")
         
         # Title
         title_cell = ws.cell(row=1, column=1)
         title_cell.value = "Inline Code Detection Report"
-        title_cell.font = Font(bold=True, size=16, color="2F75B5")
+        title_cell.font = _TITLE_FONT
         
         # Metadata
         ws.cell(row=3, column=1, value="Generated:")
@@ -183,57 +312,43 @@ class Reporter:
 
         # Stats Breakdown
         
-        # 1. Inline JS (Attributes: onclick, javascript:) -> Matches User "Inline"
-        inline_js_attr = len([f for f in self.findings if f.category == 'JS' and f.source_type == 'INLINE' and f.code_type != 'scriptblock'])
-        
-        # 2. Internal JS (Script Blocks) -> Matches User "Internal"
-        internal_js_blocks = len([f for f in self.findings if f.category == 'JS' and f.source_type == 'INLINE' and f.code_type == 'scriptblock'])
-        
-        # 3. External JS (All src references: Local files AND Remote URLs) -> Matches User "External"
-        # Parser labels local src as 'source_type=LOCAL'. Remote as 'REMOTE'.
-        external_js_refs = len([f for f in self.findings if f.category in ['JS', 'External', 'Internal'] and f.source_type in ['LOCAL', 'REMOTE']])
-        # Note: We filter strictly just in case category names vary, but source_type is the source of truth here.
-        # Actually, let's be precise based on 'JS'/'External' categories in parser:
-        # local src -> category='Internal', source='LOCAL'
-        # remote src -> category='External', source='REMOTE'
-        # We want to group BOTH as "External" in the report.
-        external_js_combined = len([f for f in self.findings if f.source_type in ['LOCAL', 'REMOTE'] and ('script' in f.code_type.lower() or f.category in ['JS', 'Internal', 'External']) and 'css' not in f.code_type.lower() and 'style' not in f.code_type.lower()])
-
-        # CSS Logic
-        inline_css_attr = len([f for f in self.findings if f.category == 'CSS' and f.source_type == 'INLINE' and 'styleblock' not in f.code_type])
-        internal_css_blocks = len([f for f in self.findings if f.category == 'CSS' and f.source_type == 'INLINE' and f.code_type == 'styleblock'])
-        
-        # External CSS (Local <link> + Remote <link>)
-        external_css_combined = len([f for f in self.findings if f.source_type in ['LOCAL', 'REMOTE'] and ('style' in f.code_type.lower() or 'css' in f.code_type.lower() or f.category == 'CSS')])
+        # Single pass over findings for all six inventory buckets
+        buckets = self._bucketize()
+        inline_js_attr = buckets["inline_js_attr"]
+        internal_js_blocks = buckets["internal_js_blocks"]
+        external_js_combined = buckets["external_js_combined"]
+        inline_css_attr = buckets["inline_css_attr"]
+        internal_css_blocks = buckets["internal_css_blocks"]
+        external_css_combined = buckets["external_css_combined"]
 
         # Explicit sum
         total_count = inline_js_attr + internal_js_blocks + external_js_combined + inline_css_attr + internal_css_blocks + external_css_combined
         
         # Debug
-        if len(self.findings) != total_count:
+        if logging.getLogger().isEnabledFor(logging.DEBUG) and len(self.findings) != total_count:
             # It's possible some finding falls through if code_type/category is weird.
             logging.debug(f"Note: Total findings ({len(self.findings)}) != Displayed Sum ({total_count}).")
         
         # AJAX & Dynamic Stats (Literal Counts)
         ajax_count = sum([getattr(f, 'ajax_count', 0) for f in self.findings])
-        inline_ajax = sum([getattr(f, 'ajax_count', 0) for f in self.findings if f.ajax_detected and f.is_inline_ajax])
-        external_ajax = sum([getattr(f, 'ajax_count', 0) for f in self.findings if f.ajax_detected and not f.is_inline_ajax])
-        server_deps = sum([getattr(f, 'ajax_count', 0) for f in self.findings if f.ajax_detected and f.has_server_deps])
-        clean_ajax = sum([getattr(f, 'ajax_count', 0) for f in self.findings if f.ajax_detected and f.is_inline_ajax and not f.has_server_deps])
+        inline_ajax = sum([getattr(f, 'ajax_count', 0) for f in self.findings if (f.flags & (HAS_AJAX | IS_INLINE_AJAX)) == HAS_AJAX | IS_INLINE_AJAX])
+        external_ajax = sum([getattr(f, 'ajax_count', 0) for f in self.findings if (f.flags & (HAS_AJAX | IS_INLINE_AJAX)) == HAS_AJAX])
+        server_deps = sum([getattr(f, 'ajax_count', 0) for f in self.findings if (f.flags & (HAS_AJAX | HAS_SERVERDEPS)) == HAS_AJAX | HAS_SERVERDEPS])
+        clean_ajax = sum([getattr(f, 'ajax_count', 0) for f in self.findings if (f.flags & (HAS_AJAX | IS_INLINE_AJAX | HAS_SERVERDEPS)) == HAS_AJAX | IS_INLINE_AJAX])
         
         dynamic_count = sum([getattr(f, 'dynamic_count', 0) for f in self.findings])
 
         # Table Header
-        ws.cell(row=6, column=1, value="Detection Summary").font = Font(bold=True, size=14)
+        ws.cell(row=6, column=1, value="Detection Summary").font = _SECTION_FONT
         
         headers = ["Category", "Count", "Criteria / Reference"]
         header_row = 7
         for col, h in enumerate(headers, 1):
             cell = ws.cell(row=header_row, column=col)
             cell.value = h
-            cell.font = Font(bold=True, color="FFFFFF")
-            cell.fill = PatternFill("solid", fgColor="4F81BD")
-            cell.alignment = Alignment(horizontal="left")
+            cell.font = _HEADER_FONT
+            cell.fill = _HEADER_FILL
+            cell.alignment = _LEFT_ALIGN
 
         # Table Data
         data = [
@@ -263,7 +378,7 @@ class Reporter:
             ws.cell(row=row, column=3, value=criteria)
             # Add simple border
             for col in [1, 2, 3]:
-                ws.cell(row=row, column=col).border = Border(bottom=Side(style='thin'))
+                ws.cell(row=row, column=col).border = _BOTTOM_BORDER
 
         # Adjust widths
         ws.column_dimensions['A'].width = 35
@@ -277,7 +392,7 @@ class Reporter:
         headers = ["File Path", "File Name", "Context", "Line", "Code Snippet", "Full Code"]
         data = []
         # Filter: JS + Inline Source + NOT Script Block
-        findings = [f for f in self.findings if f.category == 'JS' and f.source_type == 'INLINE' and f.code_type != 'scriptblock']
+        findings = [f for f in self.findings if (f.flags & (INLINE_JS | CT_SCRIPTBLOCK)) == INLINE_JS]
         
         for f in findings:
             data.append([
@@ -295,7 +410,7 @@ class Reporter:
         headers = ["File Path", "File Name", "Extracted File", "Line", "Length (Lines)", "AJAX?", "Code Snippet", "Full Code"]
         data = []
         # Filter: JS + Inline Source + IS Script Block
-        findings = [f for f in self.findings if f.category == 'JS' and f.source_type == 'INLINE' and f.code_type == 'scriptblock']
+        findings = [f for f in self.findings if (f.flags & (INLINE_JS | CT_SCRIPTBLOCK)) == INLINE_JS | CT_SCRIPTBLOCK]
         
         for f in findings:
             data.append([
@@ -306,7 +421,7 @@ class Reporter:
                 (f.end_line - f.start_line),
                 "Yes" if f.ajax_detected else "No",
                 f.snippet,
-                f.full_code
+                self._extracted_link(f)
             ])
         self._create_sheet("Internal JS (Blocks)", headers, data)
 
@@ -323,17 +438,17 @@ class Reporter:
         # AND 'script' keyword check for Internal/External to filter out CSS
         
         findings = [f for f in self.findings if 
-                    (f.category == 'JS' and f.source_type == 'LOCAL') or 
-                    ((f.category == 'Internal' or f.category == 'External') and 'script' in f.code_type.lower())]
+                    (f.flags & LOCAL_JS) == LOCAL_JS or 
+                    (f.flags & CAT_REFERENCE and f.flags & CT_SCRIPTLIKE)]
 
         for f in findings:
             # For standalone files, the "Source" is the file itself. For references, it's the src attribute.
-            src_url = f.snippet if f.category in ['Internal', 'External'] else "Self"
-            is_remote = "Yes" if f.source_type == 'REMOTE' else "No"
+            src_url = f.snippet if f.flags & CAT_REFERENCE else "Self"
+            is_remote = "Yes" if f.flags & SRC_REMOTE else "No"
             
             # AJAX Status logic
             ajax_status = "N/A (Reference)"
-            if f.category == 'JS' and f.source_type == 'LOCAL':
+            if (f.flags & LOCAL_JS) == LOCAL_JS:
                  ajax_status = "Yes" if f.ajax_detected else "No"
             
             data.append([
@@ -353,7 +468,7 @@ class Reporter:
         headers = ["File Path", "File Name", "Attribute", "Line", "Code Snippet"]
         data = []
         # Filter: CSS + Inline Source + NOT Style Block
-        findings = [f for f in self.findings if f.category == 'CSS' and f.source_type == 'INLINE' and 'styleblock' not in f.code_type]
+        findings = [f for f in self.findings if (f.flags & (INLINE_CSS | CT_STYLEBLOCK)) == INLINE_CSS]
         
         for f in findings:
             data.append([
@@ -370,7 +485,7 @@ class Reporter:
         headers = ["File Path", "File Name", "Extracted File", "Line", "Code Snippet", "Full Code"]
         data = []
         # Filter: CSS + Inline Source + IS Style Block
-        findings = [f for f in self.findings if f.category == 'CSS' and f.source_type == 'INLINE' and 'styleblock' in f.code_type]
+        findings = [f for f in self.findings if (f.flags & (INLINE_CSS | CT_STYLEBLOCK)) == INLINE_CSS | CT_STYLEBLOCK]
         
         for f in findings:
             data.append([
@@ -379,7 +494,7 @@ class Reporter:
                 f.bundled_file,
                 f.start_line,
                 f.snippet,
-                f.full_code
+                self._extracted_link(f)
             ])
         self._create_sheet("Internal CSS (Blocks)", headers, data)
 
@@ -393,12 +508,12 @@ class Reporter:
         # b) Category=Internal/External + 'style'/'css' in type
         
         findings = [f for f in self.findings if 
-                    (f.category == 'CSS' and f.source_type == 'LOCAL') or 
-                    ((f.category == 'Internal' or f.category == 'External') and ('style' in f.code_type.lower() or 'css' in f.code_type.lower()))]
+                    (f.flags & LOCAL_CSS) == LOCAL_CSS or 
+                    (f.flags & CAT_REFERENCE and f.flags & CT_STYLELIKE)]
 
         for f in findings:
-            src_url = f.snippet if f.category in ['Internal', 'External'] else "Self"
-            is_remote = "Yes" if f.source_type == 'REMOTE' else "No"
+            src_url = f.snippet if f.flags & CAT_REFERENCE else "Self"
+            is_remote = "Yes" if f.flags & SRC_REMOTE else "No"
             
             data.append([
                 f.file_path,
@@ -410,56 +525,64 @@ class Reporter:
             ])
         self._create_sheet("External CSS (Files)", headers, data)
 
-    def _create_sheet(self, title: str, headers: List[str], data_rows: List[List[str]]):
+    def _create_sheet(self, title: str, headers: List[str], data_rows: List[List[str]], per_cell_styles: dict = None):
+        """Writes a header + data table. per_cell_styles maps (row, col) -> (fill, font), applied during the write."""
         ws = self.wb.create_sheet(title)
         
-        # Header Style
-        header_font = Font(bold=True, color="FFFFFF")
-        header_fill = PatternFill("solid", fgColor="4F81BD")
-        alignment = Alignment(horizontal="left", vertical="center", wrap_text=True)
-        thin_border = Border(left=Side(style='thin'), right=Side(style='thin'), top=Side(style='thin'), bottom=Side(style='thin'))
-
         # Write Headers
+        widths = [len(str(h)) for h in headers]
         for col_num, header in enumerate(headers, 1):
             cell = ws.cell(row=1, column=col_num)
             cell.value = header
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = alignment
-            cell.border = thin_border
+            cell.font = _HEADER_FONT
+            cell.fill = _HEADER_FILL
+            cell.alignment = _HEADER_ALIGN
+            cell.border = _THIN_BORDER
 
-        # Write Data
+        # Write Data (column widths are tracked here so nothing is read back afterwards)
         for row_num, row_data in enumerate(data_rows, 2):
             for col_num, cell_value in enumerate(row_data, 1):
                 cell = ws.cell(row=row_num, column=col_num)
-                val_str = str(cell_value)
+                # Strings (the bulk, incl. code columns) pass through without a copy
+                val_str = cell_value if isinstance(cell_value, str) else ("" if cell_value is None else str(cell_value))
+                val_len = len(val_str)
                 # Excel cell limit is 32767 chars
-                if len(val_str) > 32000:
+                if val_len > 32000:
                     val_str = val_str[:32000] + "..."
+                    val_len = len(val_str)
                 cell.value = val_str
+                if val_len > widths[col_num - 1]:
+                    widths[col_num - 1] = val_len
                 
                 # Align top for readability
-                cell.alignment = Alignment(vertical="top", wrap_text=True if len(val_str) > 50 else False)
-                cell.border = thin_border
+                cell.alignment = _TOP_WRAP_ALIGN if val_len > 50 else _TOP_ALIGN
+                
+                if per_cell_styles:
+                    style = per_cell_styles.get((row_num, col_num))
+                    if style:
+                        cell.fill, cell.font = style
+
+        # Grid borders come from a sheet-wide table style instead of per-cell borders
+        if data_rows:
+            ref = f"A1:{get_column_letter(len(headers))}{len(data_rows) + 1}"
+            if isinstance(ws, StreamingWorksheet):
+                # Tables are unavailable in constant-memory mode; keep the filter buttons
+                ws.autofilter(ref)
+            else:
+                table = Table(displayName="tbl_" + "".join(c if c.isalnum() else "_" for c in title), ref=ref)
+                table.tableStyleInfo = TableStyleInfo(name="TableStyleLight1", showRowStripes=True)
+                ws.add_table(table)
 
         # Adjust column widths (basic heuristic)
-        for col_num, col in enumerate(ws.columns, 1):
-            max_length = 0
-            column_letter = col[0].column_letter
+        for col_num, header_val in enumerate(headers, 1):
+            column_letter = get_column_letter(col_num)
             
             # Don't auto-expand "Full Code" or "Snippet" too much
-            header_val = ws.cell(row=1, column=col_num).value
             if header_val in ["Code Snippet", "Full Code", "Resource Path"]:
                 ws.column_dimensions[column_letter].width = 50
                 continue
                 
-            for cell in col:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-            adjusted_width = (max_length + 2)
+            adjusted_width = (widths[col_num - 1] + 2)
             if adjusted_width > 50: adjusted_width = 50
             if adjusted_width < 10: adjusted_width = 10
             ws.column_dimensions[column_letter].width = adjusted_width
@@ -471,9 +594,14 @@ class Reporter:
         headers = ["#", "File Path", "File Name", "Category", "Capability", "Is Valid Call?", "Start Line", "End Line", 
                    "Endpoint/URL", "Has Server Dependencies", "Is Inline?", "Is Internal?", "Is External?", "Code Snippet", "Full Code"]
         data = []
+        # Server Dependencies column (J = column 10) is color coded while rows are built
+        server_col = 10
+        red = (_RED_FILL, _RED_FONT)
+        green = (_GREEN_FILL, _GREEN_FONT)
+        styles = {}
         
         # Filter only AJAX-detected findings
-        ajax_findings = [f for f in self.findings if f.ajax_detected]
+        ajax_findings = [f for f in self.findings if f.flags & HAS_AJAX]
         
         row_num = 1
         for f in ajax_findings:
@@ -481,10 +609,12 @@ class Reporter:
             is_inline = "Yes" if f.source_type == 'INLINE' else "No"
             is_internal = "Yes" if f.source_type == 'LOCAL' else "No"
             is_external = "Yes" if f.source_type == 'REMOTE' else "No"
+            server_style = red if f.has_server_deps else green
             
             # Use details list if available (Gold Standard)
             if getattr(f, 'ajax_details', None):
                 for detail in f.ajax_details:
+                    styles[(row_num + 1, server_col)] = server_style
                     data.append([
                         row_num,
                         f.file_path,
@@ -505,6 +635,7 @@ class Reporter:
                     row_num += 1
             else:
                 # Fallback
+                styles[(row_num + 1, server_col)] = server_style
                 data.append([
                     row_num,
                     f.file_path,
@@ -524,22 +655,7 @@ class Reporter:
                 ])
                 row_num += 1
         
-        self._create_sheet("AJAX Code", headers, data)
-        
-        # Apply color coding to the AJAX tab
-        if "AJAX Code" in self.wb.sheetnames:
-            ws = self.wb["AJAX Code"]
-            
-            # Color code rows (starting from row 2, after header)
-            for row in range(2, ws.max_row + 1):
-                # Server Dependencies column (J = column 10 now due to shift)
-                server_cell = ws.cell(row=row, column=10)
-                if server_cell.value == "Yes":
-                    server_cell.fill = PatternFill("solid", fgColor="FFC7CE")  # Red
-                    server_cell.font = Font(color="9C0006")
-                else:
-                    server_cell.fill = PatternFill("solid", fgColor="C6EFCE")  # Green
-                    server_cell.font = Font(color="006100")
+        self._create_sheet("AJAX Code", headers, data, per_cell_styles=styles)
 
     def _create_refactoring_sheet(self, category_filter: str = None):
         """Generates Tab 4: Refactoring & Extraction Tracker (Developer Checklist).
@@ -552,32 +668,24 @@ class Reporter:
             "Extraction Status", "Target Filename", "Recommended Method", "Dev Notes"
         ]
         data = []
+        # Extraction Status (column 6) is color coded while rows are built
+        status_col = 6
+        styles = {}
+        
+        category_mask = {'JS': CAT_JS, 'CSS': CAT_CSS}.get(category_filter, CAT_JS | CAT_CSS)
         
         row_num = 1
         for f in self.findings:
             # Filter Logic
-            if category_filter:
-                if f.category != category_filter:
-                    continue
-            elif f.category not in ['JS', 'CSS']:
-                 continue
+            if not f.flags & category_mask:
+                continue
                  
-            # Traffic Light Logic based on Severity and Complexity
-            status = "🟢 Ready"
-            method = "Move to separate file"
+            # Traffic Light Logic based on Severity and Complexity (one table lookup)
+            key = (_SEVERITY_BITS.get(f.server_severity, 0) << 2) | (_COMPLEXITY_BITS.get(f.complexity, 0) << 1) | _FUNCTIONALITY_BITS.get(f.functionality, 0)
+            status, method, style = _STATUS_TABLE[key]
             
-            if f.server_severity == "High":
-                status = "🔴 Skipped (Blocked)"
-                method = "Remove Server Dependencies First"
-            elif f.server_severity == "Medium":
-                status = "🟡 Skipped (Rewrite)"
-                method = "Refactor Server Config (API)"
-            elif f.complexity == "High":
-                status = "🟡 Manual Review"
-                method = "Convert to Component (Complex Logic)"
-            elif f.functionality == "Page Glue":
-                status = "🟢 Leave Inline"
-                method = "None (Low Value)"
+            if style:
+                styles[(row_num + 1, status_col)] = style
                 
             # Generate Target Filename Recommendation (Strict Convention)
             # {OriginalFilePath}_{BlockType}_L{StartLine}-L{EndLine}.{Extension}
@@ -603,23 +711,7 @@ class Reporter:
             ])
             row_num += 1
             
-        self._create_sheet(sheet_title, headers, data)
-        
-        # Color coding for Status
-        if sheet_title in self.wb.sheetnames:
-            ws = self.wb[sheet_title]
-            for row in range(2, ws.max_row + 1):
-                status_cell = ws.cell(row=row, column=6)
-                val = status_cell.value
-                if "Blocked" in val:
-                    status_cell.fill = PatternFill("solid", fgColor="FFC7CE") # Red
-                    status_cell.font = Font(color="9C0006")
-                elif "Skipped" in val or "Manual" in val:
-                    status_cell.fill = PatternFill("solid", fgColor="FFEB9C") # Yellow
-                    status_cell.font = Font(color="9C6500")
-                elif "Ready" in val:
-                    status_cell.fill = PatternFill("solid", fgColor="C6EFCE") # Green
-                    status_cell.font = Font(color="006100")
+        self._create_sheet(sheet_title, headers, data, per_cell_styles=styles)
 
     def _create_legend_sheet(self):
         """Creates a Legend tab explaining the metrics."""
@@ -632,14 +724,16 @@ class Reporter:
             ("AJAX Calls", "Detected Asynchronous JavaScript patterns (local or remote).", "Indicates data flow. High count = Heavy API dependency."),
             ("Logic Density", "Score based on loops, conditionals, and logic structure.", "Low (<2) = Glue Code (keep inline?), High (>5) = Business Logic (Must Extract)."),
             ("Server Severity", "Presence of @Model, @ViewBag (Razor) or <% (ASP).", "High = Cannot move to .js file without rewriting logic to API/JSON."),
+            ("Crawler_Input.csv", "Same rows as Crawler_Input.xlsx, written as plain CSV next to the workbook.", "Feed directly to crawlers or scripts that expect a seed list."),
+            ("Full Code (Blocks)", "Internal JS/CSS block tabs link to the block's file under extracted_code/ instead of embedding the source. Extracted File is its path inside extracted_code.zip.", "Unzip extracted_code.zip into extracted_code/ next to this workbook, then click 'open' to view the whole block. Code Snippet keeps the first 200 characters."),
         ]
         
         # Header Style
         for col, h in enumerate(headers, 1):
             cell = ws.cell(row=1, column=col)
             cell.value = h
-            cell.font = Font(bold=True, color="FFFFFF")
-            cell.fill = PatternFill("solid", fgColor="000000")
+            cell.font = _HEADER_FONT
+            cell.fill = _LEGEND_HEADER_FILL
             
         # Data
         for row_idx, row_data in enumerate(data, 2):
@@ -650,3 +744,9 @@ class Reporter:
         ws.column_dimensions['A'].width = 20
         ws.column_dimensions['B'].width = 60
         ws.column_dimensions['C'].width = 60
+
+
+def _build_tracker(config: ScannerConfig, findings: List[CodeSnippet], builder: str) -> str:
+    """Process-pool entry point: builds one workbook on a private Reporter instance."""
+    getattr(Reporter(config, findings), builder)()
+    return builder
@@ -1,5 +1,6 @@
 import os
-import glob
+import re
+import fnmatch
 from typing import List, Generator
 import logging
 from .config import ScannerConfig
@@ -7,6 +8,14 @@ from .config import ScannerConfig
 class Scanner:
     def __init__(self, config: ScannerConfig):
         self.config = config
+        # Per-file checks use values prepared once here
+        self._include_exts = frozenset(e.lower().lstrip('.') for e in config.include_extensions)
+        self._exclude_dirs = frozenset(config.exclude_folders)
+        self._max_bytes = int(config.max_file_size_mb * 1024 * 1024)
+        # All exclude_files globs in one regex; case-insensitive where fnmatch is (Windows)
+        flags = re.IGNORECASE if os.path.normcase('A') == 'a' else 0
+        patterns = [f"(?:{fnmatch.translate(p)})" for p in config.exclude_files]
+        self._exclude_re = re.compile("|".join(patterns), flags) if patterns else None
 
     def scan(self) -> Generator[str, None, None]:
         """
@@ -14,31 +23,43 @@ class Scanner:
         """
         logging.info(f"Scanning directory: {os.path.abspath(self.config.root_folder)}")
         
-        for root, dirs, files in os.walk(self.config.root_folder):
-            # Modify dirs in-place to skip excluded folders
-            dirs[:] = [d for d in dirs if d not in self.config.exclude_folders]
-            
-            for file in files:
-                file_path = os.path.join(root, file)
-                
-                if self._should_include(file, file_path):
-                    yield file_path
-
-    def _should_include(self, filename: str, filepath: str) -> bool:
+        yield from self._walk(self.config.root_folder)
+
+    def _walk(self, path: str) -> Generator[str, None, None]:
+        """scandir traversal in os.walk order: a folder's files first, then its sub-folders."""
+        subdirs = []
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    if entry.is_dir():
+                        # Skip excluded folders; like os.walk, never descend into symlinked folders
+                        if entry.name not in self._exclude_dirs and not entry.is_symlink():
+                            subdirs.append(entry.path)
+                    elif self._should_include(entry):
+                        yield entry.path
+        except OSError as e:
+            logging.warning(f"Could not read directory {path}: {e}")
+            return
+
+        for subdir in subdirs:
+            yield from self._walk(subdir)
+
+    def _should_include(self, entry: os.DirEntry) -> bool:
+        filename = entry.name
         # Check extension
-        _, ext = os.path.splitext(filename)
-        if ext.lower() not in self.config.include_extensions:
+        stem, _, ext = filename.rpartition('.')
+        if not stem or ext.lower() not in self._include_exts:
             return False
 
         # Check glob exclusions
-        for pattern in self.config.exclude_files:
-            if glob.fnmatch.fnmatch(filename, pattern):
-                return False
+        if self._exclude_re and self._exclude_re.match(filename):
+            return False
 
-        # Check file size
+        # Check file size (integer byte compare). DirEntry.stat() is cached on the entry and,
+        # on Windows, comes free from the directory read for regular files; it keeps
+        # following symlinks so a linked file is judged by its target's size.
         try:
-            size_mb = os.path.getsize(filepath) / (1024 * 1024)
-            if size_mb > self.config.max_file_size_mb:
+            if entry.stat().st_size > self._max_bytes:
                 # Optional: Log warning about skipped large file
                 return False
         except OSError:
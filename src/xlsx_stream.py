@@ -0,0 +1,231 @@
+"""
+Streaming workbook backend for the Reporter.
+
+Wraps xlsxwriter's constant_memory mode behind the small subset of the openpyxl
+API the Reporter and the refactoring assessment use (create_sheet, ws.cell/append,
+cell.font/fill/alignment/border or a named cell.style, column/row dimensions,
+merged cells). Rows are flushed to disk as soon as a later row is started, so
+memory stays flat regardless of finding count.
+"""
+from openpyxl.utils import column_index_from_string, range_boundaries
+
+try:
+    import xlsxwriter
+    from xlsxwriter.exceptions import FileCreateError
+except ImportError:
+    xlsxwriter = None
+
+
+def streaming_available() -> bool:
+    return xlsxwriter is not None
+
+
+class StreamingCell:
+    __slots__ = ("value", "font", "fill", "alignment", "border", "style")
+
+    def __init__(self, value=None):
+        self.value = value
+        self.font = None
+        self.fill = None
+        self.alignment = None
+        self.border = None
+        # Name of a style registered with add_named_style; replaces font/fill/alignment/border
+        self.style = None
+
+
+class _ColumnDimension:
+    def __init__(self, sheet, index: int):
+        self._sheet = sheet
+        self._index = index
+
+    @property
+    def width(self):
+        return None
+
+    @width.setter
+    def width(self, value):
+        self._sheet.set_column(self._index, self._index, value)
+
+
+class _ColumnDimensions:
+    def __init__(self, sheet):
+        self._sheet = sheet
+
+    def __getitem__(self, letter: str) -> _ColumnDimension:
+        return _ColumnDimension(self._sheet, column_index_from_string(letter) - 1)
+
+
+class _RowDimension:
+    def __init__(self, sheet, index: int):
+        self._sheet = sheet
+        self._index = index
+
+    @property
+    def height(self):
+        return None
+
+    @height.setter
+    def height(self, value):
+        self._sheet.set_row(self._index, value)
+
+
+class _RowDimensions:
+    def __init__(self, sheet):
+        self._sheet = sheet
+
+    def __getitem__(self, row: int) -> _RowDimension:
+        return _RowDimension(self._sheet, row - 1)
+
+
+class _MergedCells:
+    """openpyxl write-only sheets merge through ws.merged_cells.add(ref)."""
+
+    def __init__(self, ws: "StreamingWorksheet"):
+        self._ws = ws
+
+    def add(self, ref: str):
+        self._ws.merge_cells(ref)
+
+
+class StreamingWorksheet:
+    """Buffers one row of cells; the row is written once a later row is touched."""
+
+    def __init__(self, book: "StreamingWorkbook", sheet):
+        self._book = book
+        self._sheet = sheet
+        self._row_num = 0
+        self._row = {}
+        self.column_dimensions = _ColumnDimensions(sheet)
+        self.row_dimensions = _RowDimensions(sheet)
+        self.merged_cells = _MergedCells(self)
+
+    def _move_to(self, row: int):
+        if row != self._row_num:
+            if row < self._row_num:
+                raise ValueError(f"Streaming sheet rows must be written in order (row {row} after {self._row_num})")
+            self.flush()
+            self._row_num = row
+
+    def cell(self, row: int, column: int, value=None) -> StreamingCell:
+        self._move_to(row)
+        cell = self._row.get(column)
+        if cell is None:
+            cell = self._row[column] = StreamingCell()
+        if value is not None:
+            cell.value = value
+        return cell
+
+    def append(self, values):
+        # Always starts a new row, so append([]) leaves a blank one as in openpyxl
+        row = self._row_num + 1
+        self._move_to(row)
+        for col, value in enumerate(values, 1):
+            if isinstance(value, StreamingCell):
+                # A pre-styled cell, like openpyxl's WriteOnlyCell
+                self._row[col] = value
+            else:
+                self.cell(row=row, column=col, value=value)
+
+    def merge_cells(self, range_string: str):
+        """Merges a range starting on the current row; its first cell keeps its value and style."""
+        min_col, min_row, max_col, max_row = range_boundaries(range_string)
+        if min_row != self._row_num:
+            raise ValueError(f"Streaming sheets can only merge from the current row ({range_string})")
+        cell = self._row.get(min_col) or StreamingCell()
+        for col in range(min_col, max_col + 1):
+            self._row.pop(col, None)
+        self._sheet.merge_range(min_row - 1, min_col - 1, max_row - 1, max_col - 1,
+                                cell.value, self._book.cell_format(cell))
+
+    def autofilter(self, ref: str):
+        self._sheet.autofilter(ref)
+
+    def flush(self):
+        book = self._book
+        for col, cell in self._row.items():
+            fmt = book.cell_format(cell)
+            if cell.value is None:
+                if fmt is not None:
+                    self._sheet.write_blank(self._row_num - 1, col - 1, None, fmt)
+            else:
+                self._sheet.write(self._row_num - 1, col - 1, cell.value, fmt)
+        self._row = {}
+
+
+class StreamingWorkbook:
+    """openpyxl-shaped facade over an xlsxwriter constant_memory workbook."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._book = xlsxwriter.Workbook(path, {
+            'constant_memory': True,
+            'strings_to_numbers': False,
+            'strings_to_urls': False,
+            'use_zip64': True,
+        })
+        self._sheets = []
+        # Keyed by style object identity; the Reporter shares module-level style singletons
+        self._formats = {}
+        self._named_formats = {}
+
+    def create_sheet(self, title: str) -> StreamingWorksheet:
+        ws = StreamingWorksheet(self, self._book.add_worksheet(title))
+        self._sheets.append(ws)
+        return ws
+
+    def add_named_style(self, style):
+        """Registers an openpyxl NamedStyle; cells then refer to it through cell.style."""
+        self._named_formats[style.name] = self._book.add_format(
+            _format_properties(style.font, style.fill, style.alignment, style.border))
+
+    def cell_format(self, cell: StreamingCell):
+        if cell.style is not None:
+            return self._named_formats[cell.style]
+        return self.get_format(cell.font, cell.fill, cell.alignment, cell.border)
+
+    def get_format(self, font, fill, alignment, border):
+        if font is None and fill is None and alignment is None and border is None:
+            return None
+        key = (id(font), id(fill), id(alignment), id(border))
+        cached = self._formats.get(key)
+        if cached is None:
+            fmt = self._book.add_format(_format_properties(font, fill, alignment, border))
+            # Hold the style objects so their ids are not reused while cached
+            cached = self._formats[key] = (fmt, (font, fill, alignment, border))
+        return cached[0]
+
+    def save(self, path: str = None):
+        for ws in self._sheets:
+            ws.flush()
+        try:
+            self._book.close()
+        except FileCreateError as e:
+            raise PermissionError(str(e)) from e
+
+
+def _format_properties(font, fill, alignment, border) -> dict:
+    """Translates openpyxl style objects into an xlsxwriter format dict."""
+    props = {}
+    if font is not None:
+        if font.b:
+            props['bold'] = True
+        if font.sz:
+            props['font_size'] = font.sz
+        if font.color is not None and isinstance(font.color.rgb, str):
+            props['font_color'] = '#' + font.color.rgb[-6:]
+    if fill is not None and fill.fill_type == 'solid':
+        props['pattern'] = 1
+        props['bg_color'] = '#' + fill.fgColor.rgb[-6:]
+    if alignment is not None:
+        if alignment.horizontal:
+            props['align'] = alignment.horizontal
+        if alignment.vertical:
+            props['valign'] = 'vcenter' if alignment.vertical == 'center' else alignment.vertical
+        if alignment.wrap_text:
+            props['text_wrap'] = True
+    if border is not None:
+        for side in ('left', 'right', 'top', 'bottom'):
+            edge = getattr(border, side)
+            if edge is not None and edge.style == 'thin':
+                props[side] = 1
+    return props
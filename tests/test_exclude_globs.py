@@ -0,0 +1,44 @@
+import fnmatch
+import ntpath
+import unittest
+from unittest import mock
+from src.config import ScannerConfig
+from src.scanner import Scanner
+
+class TestExcludeGlobs(unittest.TestCase):
+    PATTERNS = {'*.min.js', 'jquery-*.js', 'Thumbs.db', 'temp?.css', '[ab]*.map'}
+    NAMES = [
+        'app.min.js', 'APP.MIN.JS', 'app.js', 'jquery-3.6.0.js', 'JQuery-UI.JS',
+        'thumbs.db', 'Thumbs.db', 'temp1.css', 'TEMP1.CSS', 'temp12.css',
+        'a.map', 'B.map', 'c.map', 'min.js.bak',
+    ]
+
+    def make_scanner(self):
+        config = ScannerConfig()
+        config.exclude_files = set(self.PATTERNS)
+        return Scanner(config)
+
+    def assert_matches_fnmatch(self):
+        scanner = self.make_scanner()
+        for name in self.NAMES:
+            with self.subTest(name=name):
+                # The original per-pattern check
+                expected = any(fnmatch.fnmatch(name, p) for p in self.PATTERNS)
+                self.assertEqual(bool(scanner._exclude_re.match(name)), expected)
+
+    def test_matches_fnmatch_on_this_platform(self):
+        self.assert_matches_fnmatch()
+
+    def test_case_insensitive_on_windows(self):
+        # fnmatch and the Scanner both go through os.path.normcase
+        with mock.patch('os.path.normcase', ntpath.normcase):
+            self.assert_matches_fnmatch()
+            scanner = self.make_scanner()
+            self.assertTrue(scanner._exclude_re.match('APP.MIN.JS'))
+            self.assertTrue(scanner._exclude_re.match('thumbs.db'))
+
+    def test_no_patterns(self):
+        self.assertIsNone(Scanner(ScannerConfig())._exclude_re)
+
+if __name__ == '__main__':
+    unittest.main()
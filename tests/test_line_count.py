@@ -0,0 +1,41 @@
+import io
+import unittest
+from unittest import mock
+from repo_depth_analyser.src import scanner
+from repo_depth_analyser.src.scanner import _count_line_breaks
+
+class TestCountLineBreaks(unittest.TestCase):
+    SAMPLES = [
+        b'',
+        b'one line',
+        b'a\nb\n',
+        b'a\r\nb\r\nc',
+        b'a\rb\rc\r',
+        b'\r\n\r\n',
+        b'\r\r\n\n\r',
+        b'mixed\r\nbreaks\nand\rlone\r',
+    ]
+
+    def text_mode_breaks(self, data):
+        # What the old text-mode read counted: universal newlines, then '\n'
+        return io.TextIOWrapper(io.BytesIO(data), encoding='utf-8', errors='ignore').read().count('\n')
+
+    def test_matches_text_mode_at_every_chunk_size(self):
+        for data in self.SAMPLES:
+            for chunk in range(1, len(data) + 2):
+                with self.subTest(data=data, chunk=chunk), mock.patch.object(scanner, 'LINE_COUNT_CHUNK', chunk):
+                    breaks, last = _count_line_breaks(io.BytesIO(data))
+                    self.assertEqual(breaks, self.text_mode_breaks(data))
+                    self.assertEqual(last, data[-1:])
+
+    def test_crlf_split_across_chunks_counts_once(self):
+        # First chunk ends with '\r', the next one starts with '\n'
+        with mock.patch.object(scanner, 'LINE_COUNT_CHUNK', 2):
+            self.assertEqual(_count_line_breaks(io.BytesIO(b'a\r\nb'))[0], 1)
+
+    def test_lone_cr_at_chunk_end_counts(self):
+        with mock.patch.object(scanner, 'LINE_COUNT_CHUNK', 2):
+            self.assertEqual(_count_line_breaks(io.BytesIO(b'a\rb'))[0], 1)
+
+if __name__ == '__main__':
+    unittest.main()
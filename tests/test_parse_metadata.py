@@ -0,0 +1,58 @@
+import re
+import unittest
+from refactoring_utility.check import parse_metadata
+
+def baseline_parse_metadata(filename):
+    # The original regex-based parser, kept as the reference behaviour
+    match = re.search(r'(.+)_([a-zA-Z0-9]+)_line(\d+)-(\d+)\.(js|css)$', filename)
+    if match:
+        sanitized, code_type, start, end, ext = match.groups()
+        return sanitized.replace('_', '/'), f"{start}-{end}", code_type, int(start), int(end)
+    return filename, "Unknown", "Unknown", 0, 0
+
+class TestParseMetadata(unittest.TestCase):
+    NAMES = [
+        # Well formed
+        'Views_Home_Index.cshtml_scriptblock_line10-25.js',
+        'Site.css_styleblock_line1-3.css',
+        'a_b_line1-2_c_line3-4.js',
+        'a_b_line01-2.js',
+        'a_b_line1-2.js\n',
+        # Malformed
+        '',
+        'noext',
+        'a_b_line1-2.ts',
+        'a_b_line1-2.JS',
+        'a_b_line1-2',
+        'a_b_line1-2.js.bak',
+        'a_b_line1-2.js\n\n',
+        'a_b_line1.js',
+        'a_b_line-2.js',
+        'a_b_line1-.js',
+        'a_b_line1-2-3.js',
+        'a_b_linex-2.js',
+        'a_b_line1-2x.js',
+        'a__line1-2.js',
+        '_b_line1-2.js',
+        'b_line1-2.js',
+        '_line1-2.js',
+        'a_b c_line1-2.js',
+        'a_bé_line1-2.js',
+        'a_b_line 1-2.js',
+        'a_b_line1-2_line.js',
+        '.js',
+        'a_b_line1-2.',
+    ]
+
+    def test_matches_baseline_regex(self):
+        for name in self.NAMES:
+            with self.subTest(name=name):
+                self.assertEqual(parse_metadata(name), baseline_parse_metadata(name))
+
+    def test_malformed_names_are_unknown(self):
+        for name in ('noext', 'a_b_line1-2.ts', 'a_b_line1.js', 'a__line1-2.js', '_line1-2.js'):
+            with self.subTest(name=name):
+                self.assertEqual(parse_metadata(name), (name, "Unknown", "Unknown", 0, 0))
+
+if __name__ == '__main__':
+    unittest.main()
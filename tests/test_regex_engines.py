@@ -0,0 +1,48 @@
+import re
+import sys
+import unittest
+from refactoring_utility import check
+from refactoring_utility.check import _AJAX_RE, _CONTROL_FLOW_RE, _SPACE, _VALUE_PATTERNS, detect_razor_patterns
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+WHITESPACE = [chr(i) for i in range(sys.maxunicode + 1) if chr(i).isspace()]
+
+SAMPLES = [
+    '', 'plain text', '@if(x)', '@IF (x)', '@If\t(x)', '@ELSE', '@foreach (var a in b)',
+    '@switch(x)', '@Using (Html.BeginForm())', '<% if x %>', '<%IF x %>', '<%　while',
+    '@İf(x)', '@ıf(x)', '@whİle(x)', '@usıng(x)', 'ſwitch', '@forK',
+    '$.ajax({})', '$.AJAX (x)', '$.get(u)', '$.Post(u)', 'x.ajax(y)', 'fetch(u)', 'FETCH (u)',
+    'new XMLHttpRequest()', 'new xmlhttprequest ()', '$http.get', 'axİos.get', 'axıos.get',
+    '@Model.Größe', '@Url.Action(@Url.Action(x))', '@ViewBag.名前', '<%=　x %>',
+] + ['@if' + w + '(' for w in WHITESPACE] + ['fetch' + w + w + '(' for w in WHITESPACE]
+
+class TestRegexEngines(unittest.TestCase):
+    def test_space_class_matches_re_whitespace(self):
+        self.assertEqual([c for c in WHITESPACE if re.fullmatch(_SPACE, c)], WHITESPACE)
+        self.assertEqual(WHITESPACE, [chr(i) for i in range(sys.maxunicode + 1) if re.fullmatch(r'\s', chr(i))])
+
+    def test_value_patterns_use_unicode_word_characters(self):
+        self.assertTrue(all(isinstance(p, re.Pattern) for p in _VALUE_PATTERNS))
+        self.assertEqual(detect_razor_patterns('var s = @Model.Größe;'),
+                         ('B', ['@Model.Größe'], 'value_injection'))
+
+    @unittest.skipIf(re2 is None, "google-re2 is not installed")
+    def test_re2_matches_like_re(self):
+        self.assertIs(check._fast_re, re2)
+        for compiled in (_CONTROL_FLOW_RE, _AJAX_RE):
+            with_re = re.compile(compiled.pattern)
+            with_re2 = re2.compile(compiled.pattern)
+            for text in SAMPLES:
+                with self.subTest(pattern=compiled.pattern[:30], text=text):
+                    expected = with_re.search(text)
+                    found = with_re2.search(text)
+                    self.assertEqual(found is None, expected is None)
+                    if expected is not None:
+                        self.assertEqual(found.span(), expected.span())
+
+if __name__ == '__main__':
+    unittest.main()